@@ -2479,8 +2479,9 @@ async def get_thread_audit(
             model=entry.model,
             reason=entry.reason,
             scope=entry.scope,
-            package_hash=entry.package_hash,
-            response_hash=entry.response_hash,
+            # Raw digests in the DB; hex at the API boundary
+            package_hash=entry.package_hash.hex(),
+            response_hash=entry.response_hash.hex() if entry.response_hash else None,
             prompt_tokens=entry.prompt_tokens,
             completion_tokens=entry.completion_tokens,
             total_tokens=entry.total_tokens,
@@ -2551,7 +2552,7 @@ async def _get_next_sequence(db: AsyncSession, thread_id: str) -> int:
     return (max_sequence or -1) + 1
 
 
-def _package_hash(messages: List[Dict[str, str]], request: AddMessageRequest) -> str:
+def _package_hash(messages: List[Dict[str, str]], request: AddMessageRequest) -> bytes:
     payload = {
         "messages": messages,
         "router": {
@@ -2562,11 +2563,11 @@ def _package_hash(messages: List[Dict[str, str]], request: AddMessageRequest) ->
         "scope": request.scope.value if request.scope else None,
     }
     serialized = json.dumps(payload, sort_keys=True).encode("utf-8")
-    return hashlib.sha256(serialized).hexdigest()
+    return hashlib.sha256(serialized).digest()
 
 
-def _response_hash(content: str) -> str:
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+def _response_hash(content: str) -> bytes:
+    return hashlib.sha256(content.encode("utf-8")).digest()
 
 
 def _to_message_response(message: Message, hide_provider: bool = False) -> MessageResponse:
@@ -3016,8 +3017,9 @@ async def get_thread_audit(
             model=entry.model,
             reason=entry.reason,
             scope=entry.scope,
-            package_hash=entry.package_hash,
-            response_hash=entry.response_hash,
+            # Raw digests in the DB; hex at the API boundary
+            package_hash=entry.package_hash.hex(),
+            response_hash=entry.response_hash.hex() if entry.response_hash else None,
             prompt_tokens=entry.prompt_tokens,
             completion_tokens=entry.completion_tokens,
             total_tokens=entry.total_tokens,
@@ -3088,7 +3090,7 @@ async def _get_next_sequence(db: AsyncSession, thread_id: str) -> int:
     return (max_sequence or -1) + 1
 
 
-def _package_hash(messages: List[Dict[str, str]], request: AddMessageRequest) -> str:
+def _package_hash(messages: List[Dict[str, str]], request: AddMessageRequest) -> bytes:
     payload = {
         "messages": messages,
         "router": {
@@ -3099,11 +3101,11 @@ def _package_hash(messages: List[Dict[str, str]], request: AddMessageRequest) ->
         "scope": request.scope.value if request.scope else None,
     }
     serialized = json.dumps(payload, sort_keys=True).encode("utf-8")
-    return hashlib.sha256(serialized).hexdigest()
+    return hashlib.sha256(serialized).digest()
 
 
-def _response_hash(content: str) -> str:
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+def _response_hash(content: str) -> bytes:
+    return hashlib.sha256(content.encode("utf-8")).digest()
 
 
 def _to_message_response(message: Message, hide_provider: bool = False) -> MessageResponse:
@@ -187,10 +187,13 @@ async def download_attachment(
             # Fall through to BLOB fallback
             file_data = None
 
-    # Fallback to legacy BLOB storage
+    # Fallback to legacy BLOB storage (file_data is deferred; load it only here)
     if file_data is None:
-        if attachment.file_data:
-            file_data = attachment.file_data
+        blob = await db.scalar(
+            select(Attachment.file_data).where(Attachment.id == attachment.id)
+        )
+        if blob:
+            file_data = blob
             logger.info(f"Using legacy BLOB storage for attachment {attachment_id}")
         else:
             raise HTTPException(
@@ -17,6 +17,18 @@ These prompts are designed to:
 - Maintain professional voice throughout
 """
 
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from string import Formatter
+from types import MappingProxyType
+from typing import Iterator, NamedTuple, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
 GLOBAL_COLLAB_PROMPT = """You are part of Syntra's 6-stage multi-model collaboration engine.
 
 CORE PIPELINE (always executes in this order):
@@ -330,18 +342,268 @@ Output format:
 - Then go into well-structured sections based on the question (e.g., "Current Landscape", "Comparison", "Trade-offs", "Practical Implications").
 - Use your best judgment on structure; the Council's verdict guides content, not organization."""
 
-# Map of stage IDs to their system prompts
-STAGE_SYSTEM_PROMPTS = {
+class Msg(NamedTuple):
+    """A chat message. Use ._asdict() where a provider SDK needs a dict."""
+    role: str
+    content: Union[str, list]  # list of content blocks for cache-annotated prompts
+
+
+# Map of stage IDs to their system prompts (read-only: prompt caching relies
+# on these staying byte-identical for the life of the process)
+STAGE_SYSTEM_PROMPTS = MappingProxyType({
     "analyst": ANALYST_PROMPT,
     "researcher": RESEARCHER_PROMPT,
     "creator": CREATOR_PROMPT,
     "critic": CRITIC_PROMPT,
     "council": COUNCIL_PROMPT,
     "synth": SYNTH_PROMPT,
+})
+
+# Global + stage prompt joined the way stage runners send them as one system prompt
+FUSED_SYSTEM_PROMPTS = MappingProxyType({
+    stage_id: f"{GLOBAL_COLLAB_PROMPT}\n\n{prompt}"
+    for stage_id, prompt in STAGE_SYSTEM_PROMPTS.items()
+})
+
+
+# ============================================================================
+# STAGE USER-MESSAGE TEMPLATES
+# ============================================================================
+#
+# Each stage's user message is a module-level str.format_map template.
+# build_messages_for_stage renders it in one call; iter_user_content_parts
+# walks the same template, pre-parsed at import, and yields fragments so
+# transports that stream a request body never hold the full (potentially
+# tens of KB) synth message in memory.
+
+_USER_TEMPLATES = {
+    "analyst": "User question:\n{user_question}",
+    "researcher": (
+        "User question:\n{user_question}"
+        "\n\n[Analyst analysis]\n{analyst_output}"
+    ),
+    "creator": (
+        "User question:\n{user_question}"
+        "\n\n[Analyst analysis]\n{analyst_output}"
+        "\n\n[Researcher findings]\n{researcher_output}{creator_note}"
+    ),
+    "critic": (
+        "User question:\n{user_question}"
+        "\n\n[Analyst analysis]\n{analyst_output}"
+        "\n\n[Researcher findings]\n{researcher_output}{drafts_section}"
+    ),
+    "council": (
+        "User question:\n{user_question}"
+        "\n\n[Analyst analysis]\n{analyst_output}"
+        "\n\n[Researcher findings]\n{researcher_output}{drafts_section}"
+        "\n\n[Critic review]\n{critic_output}"
+    ),
+    "synth": (
+        "User question:\n{user_question}"
+        "\n\n[Analyst notes]\n{analyst_output}"
+        "\n\n[Researcher findings]\n{researcher_output}{drafts_section}"
+        "\n\n[Critic review]\n{critic_output}{verdict_section}"
+    ),
+}
+
+# (literal, field) segments of each template, parsed once
+_TEMPLATE_SEGMENTS = {
+    stage_id: tuple((literal, field) for literal, field, _, _ in Formatter().parse(template))
+    for stage_id, template in _USER_TEMPLATES.items()
+}
+
+# Per-stage user-message renderers: stage_id -> bound template.format_map
+_USER_RENDERERS = {
+    stage_id: template.format_map
+    for stage_id, template in _USER_TEMPLATES.items()
+}
+
+
+class _StrDefault(dict):
+    """Context view that renders missing sections as empty strings."""
+
+    def __missing__(self, key):
+        return ""
+
+
+# Appended to the creator message when other creators are also drafting
+_CREATOR_MULTI_NOTE = "\n\nNote: Multiple models will generate drafts (you are one of them). Each draft should be a complete, high-quality answer."
+
+# Soft cap on each creator draft embedded in downstream stage prompts.
+# Stages can override it with context["max_draft_chars"].
+MAX_DRAFT_CHARS = 12000
+
+
+def _clip(content: str, limit: int) -> str:
+    """Truncate content to limit chars with a deterministic tail marker."""
+    if len(content) <= limit:
+        return content
+    return f"{content[:limit]}\n…[truncated {len(content) - limit} chars]"
+
+
+@lru_cache(maxsize=64)
+def _render_draft(number: int, model_id: str, content: str, limit: int) -> str:
+    # Critic, council and synth render the same drafts; memoizing on the
+    # draft strings lets later stages reuse the first stage's rendering.
+    return f"Draft {number} from {model_id}:\n{_clip(content, limit)}\n"
+
+
+def _iter_creator_drafts(drafts, limit: int = MAX_DRAFT_CHARS) -> Iterator[str]:
+    """Yield the creator drafts section shared by critic, council and synth."""
+    if not drafts:
+        return
+    yield "\n[Creator drafts]\n"
+    for i, d in enumerate(drafts):
+        if i:
+            yield "\n"
+        yield _render_draft(i + 1, d["model_id"], d["content"], limit)
+
+
+def _render_drafts(drafts, limit: int = MAX_DRAFT_CHARS) -> str:
+    """Render the creator drafts section as one string (non-streaming path)."""
+    if not drafts:
+        return ""
+    buf = ["\n[Creator drafts]\n"]
+    append = buf.append
+    for i, d in enumerate(drafts):
+        if i:
+            append("\n")
+        append(_render_draft(i + 1, d["model_id"], d["content"], limit))
+    return "".join(buf)
+
+
+# Serialized council verdicts by id(). Entries keep a reference to the
+# verdict so its id cannot be reused while cached; verdicts are treated as
+# immutable once the council has issued them.
+_VERDICT_TEXT_CACHE: "OrderedDict[int, Tuple[object, str]]" = OrderedDict()
+_VERDICT_TEXT_CACHE_SIZE = 32
+
+
+def _dump_verdict(verdict) -> str:
+    cached = _VERDICT_TEXT_CACHE.get(id(verdict))
+    if cached is not None and cached[0] is verdict:
+        return cached[1]
+
+    # orjson indents in C; the stdlib fallback stays compact because
+    # indent= forces json's slow pure-Python encoder.
+    if orjson is not None:
+        text = orjson.dumps(verdict, option=orjson.OPT_INDENT_2).decode()
+    else:
+        text = json.dumps(verdict, separators=(",", ":"))
+
+    _VERDICT_TEXT_CACHE[id(verdict)] = (verdict, text)
+    if len(_VERDICT_TEXT_CACHE) > _VERDICT_TEXT_CACHE_SIZE:
+        _VERDICT_TEXT_CACHE.popitem(last=False)
+    return text
+
+
+def _iter_council_verdict(verdict) -> Iterator[str]:
+    if verdict:
+        yield "\n[LLM Council verdict (JSON)]\n"
+        yield _dump_verdict(verdict)
+
+
+def _drafts_limit(fields: dict) -> int:
+    return fields.get("max_draft_chars", MAX_DRAFT_CHARS)
+
+
+# Template fields derived from the raw context, rendered on first use
+_DERIVED_FIELDS = {
+    "creator_note": lambda f: _CREATOR_MULTI_NOTE if f["creator_drafts"] else "",
+    "drafts_section": lambda f: _render_drafts(f["creator_drafts"], _drafts_limit(f)),
+    "verdict_section": lambda f: "".join(_iter_council_verdict(f["council_verdict"])),
+}
+
+# Streaming variants of the derived fields that can be large
+_DERIVED_FIELD_ITERS = {
+    "drafts_section": lambda f: _iter_creator_drafts(f["creator_drafts"], _drafts_limit(f)),
+    "verdict_section": lambda f: _iter_council_verdict(f["council_verdict"]),
 }
 
 
-def build_messages_for_stage(stage_id: str, user_question: str, context: dict):
+class _TemplateFields(_StrDefault):
+    """Template fields: the stage context plus lazily derived sections."""
+
+    def __missing__(self, key):
+        derive = _DERIVED_FIELDS.get(key)
+        if derive is None:
+            return ""
+        value = self[key] = derive(self)
+        return value
+
+
+def _template_fields(user_question: str, context: dict) -> _TemplateFields:
+    fields = _TemplateFields(context)
+    fields["user_question"] = user_question
+    return fields
+
+
+def iter_user_content_parts(stage_id: str, user_question: str, context: dict) -> Iterator[str]:
+    """
+    Yield the user-message content for a stage as a sequence of fragments.
+
+    "".join(iter_user_content_parts(...)) is byte-identical to the user
+    message content produced by build_messages_for_stage.
+
+    Raises:
+        KeyError: If stage_id is not a known stage
+    """
+    segments = _TEMPLATE_SEGMENTS[stage_id]
+    return _iter_segments(segments, _template_fields(user_question, context))
+
+
+def _iter_segments(segments: tuple, fields: _TemplateFields) -> Iterator[str]:
+    field_iters = _DERIVED_FIELD_ITERS.get
+    for literal, field in segments:
+        if literal:
+            yield literal
+        if field is None:
+            continue
+        field_iter = field_iters(field)
+        if field_iter is not None:
+            yield from field_iter(fields)
+        else:
+            yield str(fields[field])
+
+
+_GLOBAL_SYSTEM_MESSAGE = Msg("system", GLOBAL_COLLAB_PROMPT)
+
+# Prebuilt system messages per stage (global prompt + stage prompt)
+PREBUILT_SYSTEM_MESSAGES = MappingProxyType({
+    stage_id: (
+        _GLOBAL_SYSTEM_MESSAGE,
+        Msg("system", prompt),
+    )
+    for stage_id, prompt in STAGE_SYSTEM_PROMPTS.items()
+})
+
+# Providers that take explicit prompt-cache breakpoints on content blocks.
+# OpenAI caches static prefixes automatically, so it keeps the flat shape.
+CACHE_CONTROL_PROVIDERS = frozenset({"anthropic"})
+
+# Same prefix as content blocks, with an ephemeral cache breakpoint on the last
+# static block so the whole global + stage prompt is served from cache
+CACHE_CONTROL_SYSTEM_MESSAGES = MappingProxyType({
+    stage_id: (
+        Msg("system", [{"type": "text", "text": GLOBAL_COLLAB_PROMPT}]),
+        Msg("system", [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]),
+    )
+    for stage_id, prompt in STAGE_SYSTEM_PROMPTS.items()
+})
+
+
+def _system_messages(stage_id: str, provider: Optional[str]) -> tuple:
+    if provider in CACHE_CONTROL_PROVIDERS:
+        return CACHE_CONTROL_SYSTEM_MESSAGES[stage_id]
+    return PREBUILT_SYSTEM_MESSAGES[stage_id]
+
+
+def build_messages_for_stage(
+    stage_id: str,
+    user_question: str,
+    context: dict,
+    provider: Optional[str] = None,
+) -> tuple:
     """
     Build the complete message list for a stage.
 
@@ -349,132 +611,122 @@ def build_messages_for_stage(stage_id: str, user_question: str, context: dict):
         stage_id: The stage identifier (analyst, researcher, creator, etc.)
         user_question: The original user question
         context: Stage context dict with analyst_output, researcher_output, etc.
+        provider: Target provider; providers in CACHE_CONTROL_PROVIDERS get
+            system prompts as content blocks tagged with cache_control
+
+    Returns:
+        Tuple of Msg(role, content) messages
+    """
+    render = _USER_RENDERERS.get(stage_id)
+    if render is None:
+        # Unknown stage: only the global collaboration prompt applies
+        return (_GLOBAL_SYSTEM_MESSAGE,)
+
+    user_message = Msg("user", render(_template_fields(user_question, context)))
+    return (*_system_messages(stage_id, provider), user_message)
+
+
+# ============================================================================
+# CACHED MESSAGE BUILDING
+# ============================================================================
+
+@lru_cache(maxsize=256)
+def _build_cached(stage_id: str, user_question: str, ctx_key: tuple, provider: Optional[str]) -> tuple:
+    analyst, researcher, drafts, critic, verdict_json, max_draft_chars = ctx_key
+    context = {
+        "analyst_output": analyst,
+        "researcher_output": researcher,
+        "creator_drafts": [{"model_id": m, "content": c} for m, c in drafts],
+        "critic_output": critic,
+        "max_draft_chars": max_draft_chars,
+    }
+    if verdict_json is not None:
+        context["council_verdict"] = json.loads(verdict_json)
+    return build_messages_for_stage(stage_id, user_question, context, provider)
+
+
+def build_messages_for_stage_cached(
+    stage_id: str,
+    user_question: str,
+    context: dict,
+    provider: Optional[str] = None,
+) -> tuple:
+    """
+    Memoized build_messages_for_stage for callers that rebuild the same stage.
+
+    Retries and prompt previews call the builder repeatedly with identical
+    inputs; this keys a bounded LRU on a hashable fingerprint of the context.
+    Call clear_stage_message_cache() once a pipeline run completes.
+    """
+    get = context.get
+    verdict = get("council_verdict")
+    verdict_json = None
+    if verdict:
+        verdict_json = json.dumps(verdict)
+
+    ctx_key = (
+        get("analyst_output", ""),
+        get("researcher_output", ""),
+        tuple((d["model_id"], d["content"]) for d in get("creator_drafts") or ()),
+        get("critic_output", ""),
+        verdict_json,
+        get("max_draft_chars", MAX_DRAFT_CHARS),
+    )
+    return _build_cached(stage_id, user_question, ctx_key, provider)
+
+
+def clear_stage_message_cache() -> None:
+    """Drop all memoized stage messages."""
+    _build_cached.cache_clear()
+
+
+def build_all_stage_messages(user_question: str, context: dict, provider: Optional[str] = None) -> dict:
+    """
+    Build the message tuples for every stage in one pass.
+
+    All stages render from one set of shared context blocks, so the
+    rendered drafts and council verdict are built once and reused. The
+    result for each stage is identical to
+    build_messages_for_stage(stage_id, user_question, context, provider).
+
+    Args:
+        user_question: The original user question
+        context: Stage context dict with every stage output available so far
+        provider: Target provider, as for build_messages_for_stage
 
     Returns:
-        List of message dicts with role and content
+        Dict mapping stage ID to its message tuple
+    """
+    blocks = build_shared_context_blocks(user_question, context)
+    return {
+        stage_id: build_messages_from_blocks(stage_id, blocks, provider)
+        for stage_id in _USER_RENDERERS
+    }
+
+
+def build_shared_context_blocks(user_question: str, context: dict) -> dict:
+    """
+    Render every context block that stage messages share, once.
+
+    The result maps block names (user_question, analyst_output,
+    researcher_output, drafts_section, critic_output, verdict_section,
+    creator_note) to rendered text. Keep it for the lifetime of a turn and
+    pass it to build_messages_from_blocks for each stage that needs it.
+    """
+    blocks = _template_fields(user_question, context)
+    for key in _DERIVED_FIELDS:
+        blocks[key]  # render and memoize the derived section
+    return blocks
+
+
+def build_messages_from_blocks(stage_id: str, blocks: dict, provider: Optional[str] = None) -> tuple:
+    """
+    Build a stage's messages from pre-rendered shared context blocks.
+
+    Equivalent to build_messages_for_stage for the same question and context.
+
+    Raises:
+        KeyError: If stage_id is not a known stage
     """
-    messages = []
-
-    # 1. Global collaboration prompt
-    messages.append({
-        "role": "system",
-        "content": GLOBAL_COLLAB_PROMPT,
-    })
-
-    # 2. Stage-specific system prompt
-    if stage_id in STAGE_SYSTEM_PROMPTS:
-        messages.append({
-            "role": "system",
-            "content": STAGE_SYSTEM_PROMPTS[stage_id],
-        })
-
-    # 3. User context message (varies by stage)
-    if stage_id == "analyst":
-        messages.append({
-            "role": "user",
-            "content": f"User question:\n{user_question}",
-        })
-
-    elif stage_id == "researcher":
-        messages.append({
-            "role": "user",
-            "content": f"""User question:
-{user_question}
-
-[Analyst analysis]
-{context.get('analyst_output', '')}""",
-        })
-
-    elif stage_id == "creator":
-        # Show all context to creator
-        creator_drafts_section = ""
-        if context.get("creator_drafts"):
-            creator_drafts_section = "\n\nNote: Multiple models will generate drafts (you are one of them). Each draft should be a complete, high-quality answer."
-
-        messages.append({
-            "role": "user",
-            "content": f"""User question:
-{user_question}
-
-[Analyst analysis]
-{context.get('analyst_output', '')}
-
-[Researcher findings]
-{context.get('researcher_output', '')}{creator_drafts_section}""",
-        })
-
-    elif stage_id == "critic":
-        # Critic sees all drafts
-        creator_drafts_section = ""
-        if context.get("creator_drafts"):
-            creator_drafts_section = "\n[Creator drafts]\n" + "\n".join(
-                [f"Draft {i + 1} from {d['model_id']}:\n{d['content']}\n"
-                 for i, d in enumerate(context["creator_drafts"])]
-            )
-
-        messages.append({
-            "role": "user",
-            "content": f"""User question:
-{user_question}
-
-[Analyst analysis]
-{context.get('analyst_output', '')}
-
-[Researcher findings]
-{context.get('researcher_output', '')}{creator_drafts_section}""",
-        })
-
-    elif stage_id == "council":
-        # Council sees all drafts + critic
-        creator_drafts_section = ""
-        if context.get("creator_drafts"):
-            creator_drafts_section = "\n[Creator drafts]\n" + "\n".join(
-                [f"Draft {i + 1} from {d['model_id']}:\n{d['content']}\n"
-                 for i, d in enumerate(context["creator_drafts"])]
-            )
-
-        messages.append({
-            "role": "user",
-            "content": f"""User question:
-{user_question}
-
-[Analyst analysis]
-{context.get('analyst_output', '')}
-
-[Researcher findings]
-{context.get('researcher_output', '')}{creator_drafts_section}
-
-[Critic review]
-{context.get('critic_output', '')}""",
-        })
-
-    elif stage_id == "synth":
-        # Synth sees everything
-        creator_drafts_section = ""
-        if context.get("creator_drafts"):
-            creator_drafts_section = "\n[Creator drafts]\n" + "\n".join(
-                [f"Draft {i + 1} from {d['model_id']}:\n{d['content']}\n"
-                 for i, d in enumerate(context["creator_drafts"])]
-            )
-
-        council_verdict = ""
-        if context.get("council_verdict"):
-            import json
-            council_verdict = f"\n[LLM Council verdict (JSON)]\n{json.dumps(context['council_verdict'], indent=2)}"
-
-        messages.append({
-            "role": "user",
-            "content": f"""User question:
-{user_question}
-
-[Analyst notes]
-{context.get('analyst_output', '')}
-
-[Researcher findings]
-{context.get('researcher_output', '')}{creator_drafts_section}
-
-[Critic review]
-{context.get('critic_output', '')}{council_verdict}""",
-        })
-
-    return messages
+    user_message = Msg("user", _USER_RENDERERS[stage_id](blocks))
+    return (*_system_messages(stage_id, provider), user_message)
@@ -8,9 +8,13 @@ This module defines:
 4. WorkflowStep: Pipeline stages without hard-coded models
 """
 
+import sys
+from bisect import bisect_left
 from enum import Enum
-from typing import List, Literal
-from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import FrozenSet, List, Literal, Tuple
+from dataclasses import dataclass, field
 from app.models.provider_key import ProviderType
 
 # ============================================================================
@@ -26,29 +30,37 @@ StageId = Literal[
     "synth"
 ]
 
+# Stage id constants, interned so every table keyed by stage shares one string
+ANALYST: StageId = sys.intern("analyst")
+RESEARCHER: StageId = sys.intern("researcher")
+CREATOR: StageId = sys.intern("creator")
+CRITIC: StageId = sys.intern("critic")
+COUNCIL: StageId = sys.intern("council")
+SYNTH: StageId = sys.intern("synth")
+
 ALL_STAGES: List[StageId] = [
-    "analyst",
-    "researcher",
-    "creator",
-    "critic",
-    "council",
-    "synth"
+    ANALYST,
+    RESEARCHER,
+    CREATOR,
+    CRITIC,
+    COUNCIL,
+    SYNTH,
 ]
 
-STAGE_LABELS = {
-    "analyst": "Analyst",
-    "researcher": "Researcher",
-    "creator": "Creator",
-    "critic": "Critic",
-    "council": "LLM Council",
-    "synth": "Synthesizer",
-}
+STAGE_LABELS = MappingProxyType({
+    ANALYST: "Analyst",
+    RESEARCHER: "Researcher",
+    CREATOR: "Creator",
+    CRITIC: "Critic",
+    COUNCIL: "LLM Council",
+    SYNTH: "Synthesizer",
+})
 
 # ============================================================================
 # PROVIDER MODELS - which LLMs are available with their strengths
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProviderModel:
     """Metadata about an available LLM model"""
     id: str  # e.g., "gpt-o", "gemini-pro", "perplexity"
@@ -57,11 +69,16 @@ class ProviderModel:
     max_tokens: int
     relative_cost: int  # 1 (cheap) to 5 (expensive)
     relative_speed: int  # 1 (slow) to 5 (fast)
-    strengths: List[StageId]  # which roles this model excels at
+    strengths: FrozenSet[StageId]  # which roles this model excels at
+    _quality_score: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # frozen: set the derived score through object.__setattr__
+        object.__setattr__(self, "_quality_score", (6 - self.relative_cost) + self.relative_speed)
 
     def quality_score(self) -> int:
         """Combined score: higher = better quality/cost/speed balance"""
-        return (6 - self.relative_cost) + self.relative_speed
+        return self._quality_score
 
 
 # Define all available models with their strengths
@@ -73,7 +90,7 @@ MODELS_REGISTRY = [
         max_tokens=32000,
         relative_cost=4,
         relative_speed=3,
-        strengths=["analyst", "critic", "council", "synth"],
+        strengths=frozenset({ANALYST, CRITIC, COUNCIL, SYNTH}),
     ),
     ProviderModel(
         id="gpt-4o-mini",
@@ -82,7 +99,7 @@ MODELS_REGISTRY = [
         max_tokens=16000,
         relative_cost=1,
         relative_speed=5,
-        strengths=["analyst", "researcher"],
+        strengths=frozenset({ANALYST, RESEARCHER}),
     ),
     ProviderModel(
         id="gemini-2.0",
@@ -91,7 +108,7 @@ MODELS_REGISTRY = [
         max_tokens=200000,
         relative_cost=3,
         relative_speed=4,
-        strengths=["analyst", "researcher", "creator", "synth"],
+        strengths=frozenset({ANALYST, RESEARCHER, CREATOR, SYNTH}),
     ),
     ProviderModel(
         id="perplexity",
@@ -100,7 +117,7 @@ MODELS_REGISTRY = [
         max_tokens=16000,
         relative_cost=3,
         relative_speed=4,
-        strengths=["researcher", "creator"],
+        strengths=frozenset({RESEARCHER, CREATOR}),
     ),
     ProviderModel(
         id="kimi",
@@ -109,17 +126,24 @@ MODELS_REGISTRY = [
         max_tokens=16000,
         relative_cost=2,
         relative_speed=3,
-        strengths=["critic", "creator"],
+        strengths=frozenset({CRITIC, CREATOR}),
     ),
 ]
 
+# Lookup indexes over the (static) registry
+_MODELS_BY_ID = {m.id: m for m in MODELS_REGISTRY}
+_MODELS_BY_STAGE = {
+    stage: [m for m in MODELS_REGISTRY if stage in m.strengths]
+    for stage in ALL_STAGES
+}
+
 
 def get_model_by_id(model_id: str) -> ProviderModel:
     """Get a model from the registry by ID"""
-    for model in MODELS_REGISTRY:
-        if model.id == model_id:
-            return model
-    raise ValueError(f"Model {model_id} not found in registry")
+    try:
+        return _MODELS_BY_ID[model_id]
+    except KeyError:
+        raise ValueError(f"Model {model_id} not found in registry") from None
 
 
 def pick_model_for_stage(
@@ -141,12 +165,32 @@ def pick_model_for_stage(
     Returns:
         ProviderModel: The selected model
     """
-    # Filter to only models that support this stage
-    candidates = [m for m in MODELS_REGISTRY if stage_id in m.strengths]
+    return _pick_model(stage_id, _token_bucket(estimated_tokens), strategy)
+
+
+# Distinct model capacities; the candidate set only changes at these values
+_TOKEN_BUCKETS = sorted({m.max_tokens for m in MODELS_REGISTRY})
+
+
+def _token_bucket(estimated_tokens: int) -> int:
+    """Smallest model capacity that fits estimated_tokens (0 = no requirement)."""
+    if estimated_tokens <= 0:
+        return 0
+    i = bisect_left(_TOKEN_BUCKETS, estimated_tokens)
+    if i == len(_TOKEN_BUCKETS):
+        return _TOKEN_BUCKETS[-1] + 1  # larger than any model
+    return _TOKEN_BUCKETS[i]
+
+
+@lru_cache(maxsize=256)
+def _pick_model(stage_id: StageId, token_bucket: int, strategy: str) -> ProviderModel:
+    # The registry is static, so each (stage, bucket, strategy) is routed once.
+    # Models that support this stage (precomputed per stage)
+    candidates = _MODELS_BY_STAGE.get(stage_id, [])
 
     # Filter to only models with sufficient token capacity
-    if estimated_tokens > 0:
-        candidates = [m for m in candidates if m.max_tokens >= estimated_tokens]
+    if token_bucket > 0:
+        candidates = [m for m in candidates if m.max_tokens >= token_bucket]
 
     if not candidates:
         # Fallback: use any available model (shouldn't happen in normal operation)
@@ -165,18 +209,21 @@ def pick_model_for_stage(
 # CREATOR POOL - which models propose answers in creator stage
 # ============================================================================
 
-CREATOR_POOL_IDS = ["gpt-4o", "gemini-2.0", "perplexity"]
+CREATOR_POOL_IDS = ("gpt-4o", "gemini-2.0", "perplexity")
 
-def get_creator_pool() -> List[ProviderModel]:
+# Resolved once; the registry and pool ids are static
+_CREATOR_POOL: Tuple[ProviderModel, ...] = tuple(get_model_by_id(id) for id in CREATOR_POOL_IDS)
+
+def get_creator_pool() -> Tuple[ProviderModel, ...]:
     """Get all models that should generate creator drafts"""
-    return [get_model_by_id(id) for id in CREATOR_POOL_IDS]
+    return _CREATOR_POOL
 
 
 # ============================================================================
 # WORKFLOW STEPS - pipeline without hard-coded models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkflowStep:
     """A stage in the collaboration pipeline (role-based, not model-based)"""
     id: StageId
@@ -185,12 +232,12 @@ class WorkflowStep:
 
 
 COLLAB_WORKFLOW_STEPS = [
-    WorkflowStep(id="analyst", label="Analyst", strategy="auto"),
-    WorkflowStep(id="researcher", label="Researcher", strategy="auto"),
-    WorkflowStep(id="creator", label="Creator", strategy="auto"),
-    WorkflowStep(id="critic", label="Critic", strategy="auto"),
-    WorkflowStep(id="council", label="LLM Council", strategy="auto"),
-    WorkflowStep(id="synth", label="Synthesizer", strategy="auto"),
+    WorkflowStep(id=ANALYST, label="Analyst", strategy="auto"),
+    WorkflowStep(id=RESEARCHER, label="Researcher", strategy="auto"),
+    WorkflowStep(id=CREATOR, label="Creator", strategy="auto"),
+    WorkflowStep(id=CRITIC, label="Critic", strategy="auto"),
+    WorkflowStep(id=COUNCIL, label="LLM Council", strategy="auto"),
+    WorkflowStep(id=SYNTH, label="Synthesizer", strategy="auto"),
 ]
 
 
@@ -198,8 +245,8 @@ COLLAB_WORKFLOW_STEPS = [
 # SYSTEM PROMPTS FOR EACH ROLE
 # ============================================================================
 
-ROLE_PROMPTS = {
-    "analyst": """You are the Analyst in a multi-model collaboration team. Your job is to break down complex problems into structured, analyzable components.
+ROLE_PROMPTS = MappingProxyType({
+    ANALYST: """You are the Analyst in a multi-model collaboration team. Your job is to break down complex problems into structured, analyzable components.
 
 Key responsibilities:
 - Identify the core problem and sub-problems
@@ -210,7 +257,7 @@ Key responsibilities:
 
 Be concise but thorough. Your analysis will guide the other specialists.""",
 
-    "researcher": """You are the Researcher in a multi-model collaboration team. Your job is to gather relevant, up-to-date information that other specialists need.
+    RESEARCHER: """You are the Researcher in a multi-model collaboration team. Your job is to gather relevant, up-to-date information that other specialists need.
 
 Key responsibilities:
 - Search for current, relevant information
@@ -221,7 +268,7 @@ Key responsibilities:
 
 Focus on factual, verifiable information. Cite your sources when possible.""",
 
-    "creator": """You are the Creator in a multi-model collaboration team. Your job is to synthesize information and create a comprehensive solution draft.
+    CREATOR: """You are the Creator in a multi-model collaboration team. Your job is to synthesize information and create a comprehensive solution draft.
 
 Key responsibilities:
 - Integrate insights from the Analyst and Researcher
@@ -232,7 +279,7 @@ Key responsibilities:
 
 Build on the analysis and research provided. Create the main content that addresses the user's needs.""",
 
-    "critic": """You are the Critic in a multi-model collaboration team. Your job is to find flaws, gaps, and areas for improvement.
+    CRITIC: """You are the Critic in a multi-model collaboration team. Your job is to find flaws, gaps, and areas for improvement.
 
 Key responsibilities:
 - Identify factual errors or outdated information
@@ -243,7 +290,7 @@ Key responsibilities:
 
 Be constructive but thorough. Your critique will help improve the final answer.""",
 
-    "council": """You are the LLM Council Judge in a multi-model collaboration system.
+    COUNCIL: """You are the LLM Council Judge in a multi-model collaboration system.
 
 Your job:
 1. Compare multiple creator drafts from different models
@@ -263,7 +310,7 @@ Respond ONLY with valid JSON in this schema:
   "speculative_claims": [string]
 }""",
 
-    "synth": """You are the Final Report Writer in a multi-model collaboration system.
+    SYNTH: """You are the Final Report Writer in a multi-model collaboration system.
 
 Upstream agents have:
 - broken down the user's request
@@ -285,4 +332,4 @@ RULES:
 
 Aim for a thorough answer (1500–2500 words for complex questions).
 The user will ONLY see your message.""",
-}
+})
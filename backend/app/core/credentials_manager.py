@@ -7,8 +7,10 @@ This module ensures API keys, tokens, and other credentials are:
 3. Stored only in secure context managers
 """
 
+import asyncio
+import ctypes
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from contextlib import asynccontextmanager
 from cryptography.fernet import Fernet
 from config import get_settings
@@ -16,12 +18,26 @@ from config import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Process-wide cipher, built once from the configured encryption key
+_fernet: Optional[Fernet] = None
+
+
+def get_fernet() -> Fernet:
+    """Get or create the shared Fernet cipher."""
+    global _fernet
+    if _fernet is None:
+        _fernet = Fernet(settings.encryption_key.encode())
+    return _fernet
+
 
 class SecureCredential:
     """Wrapper for a sensitive credential value that clears on deletion."""
 
+    __slots__ = ("_buf", "name", "_cleared")
+
     def __init__(self, value: str, name: str = "credential"):
-        self.value = value
+        # Held as a mutable buffer so clear() can scrub the bytes in place
+        self._buf = bytearray(value.encode())
         self.name = name
         self._cleared = False
 
@@ -29,13 +45,21 @@ class SecureCredential:
         """Get the credential value. Raises error if already cleared."""
         if self._cleared:
             raise ValueError(f"Credential '{self.name}' has been cleared")
-        return self.value
+        return self._buf.decode()
+
+    def get_bytes(self) -> bytes:
+        """Get the credential value as bytes, skipping the str decode."""
+        if self._cleared:
+            raise ValueError(f"Credential '{self.name}' has been cleared")
+        return bytes(self._buf)
 
     def clear(self) -> None:
         """Securely clear the credential from memory."""
         if not self._cleared:
-            # Overwrite with empty string
-            self.value = ""
+            # Zero the underlying buffer rather than just dropping the reference
+            size = len(self._buf)
+            if size:
+                ctypes.memset((ctypes.c_char * size).from_buffer(self._buf), 0, size)
             self._cleared = True
             logger.debug(f"Credential '{self.name}' cleared from memory")
 
@@ -58,7 +82,7 @@ class CredentialsManager:
     """Manages secure handling of API keys and tokens."""
 
     def __init__(self):
-        self.cipher = Fernet(settings.encryption_key.encode())
+        self.cipher = get_fernet()
 
     @asynccontextmanager
     async def use_credentials(self, api_keys: Dict[str, str]):
@@ -71,18 +95,14 @@ class CredentialsManager:
                 key = creds.get("openai_api_key")
             # Credentials automatically cleared after context exits
         """
-        # Wrap keys in SecureCredential objects
-        secure_creds = {
-            name: SecureCredential(value, name)
-            for name, value in api_keys.items()
-        }
+        # Keys are wrapped in SecureCredential objects lazily, on first access
+        secure_creds = SecureCredentialsDict(api_keys)
 
         try:
-            yield SecureCredentialsDict(secure_creds)
+            yield secure_creds
         finally:
             # Clear all credentials
-            for cred in secure_creds.values():
-                cred.clear()
+            secure_creds.clear()
 
     def encrypt_credential(self, value: str) -> bytes:
         """Encrypt a credential for storage."""
@@ -92,40 +112,98 @@ class CredentialsManager:
         """Decrypt a stored credential."""
         return self.cipher.decrypt(encrypted).decode()
 
+    def encrypt_many(self, values: List[str]) -> List[bytes]:
+        """Encrypt several credentials."""
+        encrypt = self.cipher.encrypt
+        return [encrypt(value.encode()) for value in values]
+
+    def decrypt_many(self, blobs: List[bytes]) -> List[str]:
+        """Decrypt several stored credentials."""
+        decrypt = self.cipher.decrypt
+        return [decrypt(blob).decode() for blob in blobs]
+
+    # Async variants run Fernet (CPU-bound AES + HMAC) in a worker thread so
+    # decrypting a batch of stored keys doesn't block the event loop.
+
+    async def aencrypt_credential(self, value: str) -> bytes:
+        """Encrypt a credential without blocking the event loop."""
+        return await asyncio.to_thread(self.encrypt_credential, value)
+
+    async def adecrypt_credential(self, encrypted: bytes) -> str:
+        """Decrypt a credential without blocking the event loop."""
+        return await asyncio.to_thread(self.decrypt_credential, encrypted)
+
+    async def aencrypt_many(self, values: List[str]) -> List[bytes]:
+        """Encrypt several credentials in one worker-thread hop."""
+        return await asyncio.to_thread(self.encrypt_many, values)
+
+    async def adecrypt_many(self, blobs: List[bytes]) -> List[str]:
+        """Decrypt several stored credentials in one worker-thread hop."""
+        return await asyncio.to_thread(self.decrypt_many, blobs)
+
 
 class SecureCredentialsDict:
-    """Dictionary-like interface for accessing secure credentials."""
+    """
+    Dictionary-like interface for accessing secure credentials.
+
+    Values are only wrapped in SecureCredential when first read, so requests
+    that touch one provider don't pay for wrapping every configured key.
+    """
+
+    def __init__(self, api_keys: Dict[str, str]):
+        self._raw = api_keys
+        self._credentials: Dict[str, SecureCredential] = {}
+        self._cleared = False
 
-    def __init__(self, credentials: Dict[str, SecureCredential]):
-        self._credentials = credentials
+    def _credential(self, name: str) -> SecureCredential:
+        """Get (or materialize) the SecureCredential for a known name."""
+        cred = self._credentials.get(name)
+        if cred is None:
+            cred = SecureCredential(self._raw[name], name)
+            if self._cleared:
+                cred.clear()
+            self._credentials[name] = cred
+        return cred
 
     def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
         """Get a credential by name."""
-        if name in self._credentials:
-            try:
-                return self._credentials[name].get()
-            except ValueError:
-                logger.warning(f"Attempted to access cleared credential: {name}")
-                return default
-        return default
+        try:
+            cred = self._credential(name)
+        except KeyError:
+            return default
+        try:
+            return cred.get()
+        except ValueError:
+            logger.warning("Attempted to access cleared credential: %s", name)
+            return default
 
     def __getitem__(self, name: str) -> str:
         """Get a credential by name (raises KeyError if not found)."""
-        if name not in self._credentials:
-            raise KeyError(f"Credential '{name}' not found")
-        return self._credentials[name].get()
+        try:
+            cred = self._credential(name)
+        except KeyError:
+            raise KeyError(f"Credential '{name}' not found") from None
+        return cred.get()
 
     def __contains__(self, name: str) -> bool:
         """Check if a credential exists."""
-        return name in self._credentials
+        return name in self._raw
 
     def keys(self):
         """Get credential names."""
-        return self._credentials.keys()
+        return self._raw.keys()
+
+    def clear(self) -> None:
+        """Clear every materialized credential and drop the raw values."""
+        for cred in self._credentials.values():
+            cred.clear()
+        # Keep the names (for keys()/repr) but not the secret values
+        self._raw = dict.fromkeys(self._raw, "")
+        self._cleared = True
 
     def __repr__(self):
         """Prevent accidental logging of credentials."""
-        return f"<SecureCredentialsDict with {len(self._credentials)} credentials>"
+        return f"<SecureCredentialsDict with {len(self._raw)} credentials>"
 
 
 # Global credentials manager instance
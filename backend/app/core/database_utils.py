@@ -11,6 +11,13 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Characters stripped from identifiers before the allowlist check
+_IDENT_RE = re.compile(r'[^a-zA-Z0-9_]')
+# f-string style placeholders, which must never reach a query
+_FSTRING_RE = re.compile(r'\{.*?\}')
+# Bind parameter names
+_PARAM_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+
 
 class SafeQueryBuilder:
     """
@@ -37,8 +44,11 @@ class SafeQueryBuilder:
     @classmethod
     def validate_identifier(cls, name: str, valid_set: frozenset) -> str:
         """Validate and return a safe identifier."""
+        # Allowlisted names are already clean
+        if name in valid_set:
+            return name
         # Remove any non-alphanumeric characters except underscore
-        clean_name = re.sub(r'[^a-zA-Z0-9_]', '', name)
+        clean_name = _IDENT_RE.sub('', name)
         if clean_name not in valid_set:
             raise ValueError(f"Invalid identifier: {name}")
         return clean_name
@@ -51,6 +61,26 @@ class SafeQueryBuilder:
     def validate_column(cls, column_name: str) -> str:
         return cls.validate_identifier(column_name, cls.VALID_COLUMNS)
 
+    @classmethod
+    def any_clause(cls, column_name: str, param: str) -> str:
+        """
+        Build a "<column> = ANY(:param)" filter for a list parameter.
+
+        The whole list binds as one PostgreSQL array parameter, so the
+        statement stays the same size (and plan-cacheable) for any number
+        of values, unlike an expanded IN (...) list.
+        """
+        if not _PARAM_RE.match(param):
+            raise ValueError(f"Invalid parameter name: {param}")
+        return f"{cls.validate_column(column_name)} = ANY(:{param})"
+
+    @staticmethod
+    def _check_query(query: str) -> None:
+        # Ensure query uses : param syntax, not f-strings. This guards against
+        # developer error, so optimized builds (python -O) skip the scan.
+        if __debug__ and _FSTRING_RE.search(query):
+            raise ValueError("Query contains f-string formatting. Use : param syntax.")
+
     @classmethod
     async def execute_safe(
         cls,
@@ -59,10 +89,25 @@ class SafeQueryBuilder:
         params: Dict[str, Any]
     ) -> Any:
         """Execute a parameterized query safely."""
-        # Ensure query uses : param syntax, not f-strings
-        if re.search(r'\{.*?\}', query):
-            raise ValueError("Query contains f-string formatting. Use : param syntax.")
+        cls._check_query(query)
 
-        logger.debug(f"Executing safe query: {query[:100]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing safe query: %s...", query[:100])
         return await db.execute(text(query), params)
 
+    @classmethod
+    async def execute_many_safe(
+        cls,
+        db: AsyncSession,
+        query: str,
+        params_list: List[Dict[str, Any]]
+    ) -> Optional[Any]:
+        """Execute a parameterized statement for every parameter set in one executemany call."""
+        if not params_list:
+            return None
+        cls._check_query(query)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing safe query x%d: %s...", len(params_list), query[:100])
+        return await db.execute(text(query), params_list)
+
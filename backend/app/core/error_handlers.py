@@ -1,30 +1,58 @@
 """Centralized error handling and exception handlers."""
 
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from pydantic import ValidationError
 import logging
-import traceback
-from typing import Dict, Any
-import json
+from typing import Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class DefaultJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (several times faster) when installed."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
 
 class APIError(Exception):
-    """Base exception for API errors."""
+    """
+    Base exception for API errors.
+
+    Raise a fresh instance each time. Re-raising a shared instance grows its
+    __traceback__ on every raise and leaks context between requests; the
+    fixed responses are already pre-rendered (see _CANNED_BODIES).
+    """
+
+    # message/details live in slots, so most instances never allocate a
+    # __dict__. status_code/error_code are fixed per subclass; instances
+    # only store them (in __dict__) when overridden.
+    __slots__ = ("message", "details")
+
+    status_code: int = status.HTTP_400_BAD_REQUEST
+    error_code: str = "INVALID_REQUEST"
 
     def __init__(
         self,
         message: str,
-        status_code: int = status.HTTP_400_BAD_REQUEST,
-        error_code: str = "INVALID_REQUEST",
+        status_code: Optional[int] = None,
+        error_code: Optional[str] = None,
         details: Dict[str, Any] = None
     ):
         self.message = message
-        self.status_code = status_code
-        self.error_code = error_code
+        if status_code is not None:
+            self.status_code = status_code
+        if error_code is not None:
+            self.error_code = error_code
         self.details = details or {}
         super().__init__(self.message)
 
@@ -32,177 +60,204 @@ class APIError(Exception):
 class ValidationAPIError(APIError):
     """Validation error."""
 
+    __slots__ = ()
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    error_code = "VALIDATION_ERROR"
+
     def __init__(self, message: str, details: Dict[str, Any] = None):
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            error_code="VALIDATION_ERROR",
-            details=details
-        )
+        super().__init__(message=message, details=details)
 
 
 class AuthenticationAPIError(APIError):
     """Authentication error."""
 
+    __slots__ = ()
+    status_code = status.HTTP_401_UNAUTHORIZED
+    error_code = "UNAUTHORIZED"
+
     def __init__(self, message: str = "Unauthorized"):
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            error_code="UNAUTHORIZED"
-        )
+        super().__init__(message=message)
 
 
 class AuthorizationAPIError(APIError):
     """Authorization error."""
 
+    __slots__ = ()
+    status_code = status.HTTP_403_FORBIDDEN
+    error_code = "FORBIDDEN"
+
     def __init__(self, message: str = "Forbidden"):
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_403_FORBIDDEN,
-            error_code="FORBIDDEN"
-        )
+        super().__init__(message=message)
 
 
 class NotFoundAPIError(APIError):
     """Resource not found error."""
 
+    __slots__ = ()
+    status_code = status.HTTP_404_NOT_FOUND
+    error_code = "NOT_FOUND"
+
     def __init__(self, resource: str, identifier: str = ""):
         message = f"{resource} not found"
         if identifier:
             message += f": {identifier}"
 
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_404_NOT_FOUND,
-            error_code="NOT_FOUND"
-        )
+        super().__init__(message=message)
 
 
 class ConflictAPIError(APIError):
     """Resource conflict error."""
 
+    __slots__ = ()
+    status_code = status.HTTP_409_CONFLICT
+    error_code = "CONFLICT"
+
     def __init__(self, message: str):
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_409_CONFLICT,
-            error_code="CONFLICT"
-        )
+        super().__init__(message=message)
 
 
 class RateLimitAPIError(APIError):
     """Rate limit error."""
 
+    __slots__ = ()
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+    error_code = "RATE_LIMITED"
+
     def __init__(self, message: str = "Too many requests", retry_after: int = 60):
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            error_code="RATE_LIMITED",
-            details={"retry_after": retry_after}
-        )
+        super().__init__(message=message, details={"retry_after": retry_after})
 
 
 class InternalServerError(APIError):
     """Internal server error."""
 
+    __slots__ = ()
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    error_code = "INTERNAL_ERROR"
+
     def __init__(self, message: str = "Internal server error", error_id: str = ""):
         details = {}
         if error_id:
             details["error_id"] = error_id
 
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            error_code="INTERNAL_ERROR",
-            details=details
-        )
+        super().__init__(message=message, details=details)
 
 
 def format_error_response(error: APIError) -> Dict[str, Any]:
     """Format error response in standard format."""
-    response = {
-        "error": {
-            "code": error.error_code,
-            "message": error.message
+    if error.details:
+        return {
+            "error": {
+                "code": error.error_code,
+                "message": error.message,
+                "details": error.details
+            }
         }
-    }
 
-    if error.details:
-        response["error"]["details"] = error.details
+    return {"error": {"code": error.error_code, "message": error.message}}
+
+
+# Pre-rendered bodies for fixed, detail-free errors, keyed by (code, message)
+_CANNED_BODIES: Dict[Tuple[str, str], bytes] = {
+    (error.error_code, error.message): DefaultJSONResponse(format_error_response(error)).body
+    for error in (
+        AuthenticationAPIError(),
+        AuthorizationAPIError(),
+        ConflictAPIError("Resource already exists or database constraint violation"),
+        InternalServerError("Database error occurred"),
+        InternalServerError("An unexpected error occurred"),
+    )
+}
+
 
-    return response
+_GENERIC_500_BODY = _CANNED_BODIES[("INTERNAL_ERROR", "An unexpected error occurred")]
+_DATABASE_500_BODY = _CANNED_BODIES[("INTERNAL_ERROR", "Database error occurred")]
+_DATABASE_CONFLICT_BODY = _CANNED_BODIES[
+    ("CONFLICT", "Resource already exists or database constraint violation")
+]
+
+
+def _body_response(body: bytes, status_code: int) -> Response:
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def error_response(error: APIError) -> Response:
+    """Build the JSON response for an error, reusing pre-rendered bodies."""
+    if not error.details:
+        body = _CANNED_BODIES.get((error.error_code, error.message))
+        if body is not None:
+            return _body_response(body, error.status_code)
+
+    return DefaultJSONResponse(
+        status_code=error.status_code,
+        content=format_error_response(error)
+    )
 
 
 def log_error(request: Request, error: Exception, status_code: int) -> None:
     """Log error with context (never expose traceback in response)."""
-    # Only include traceback in logs for 5xx errors (server errors)
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+
     extra = {
         "path": request.url.path,
         "method": request.method,
         "error": str(error),
     }
 
-    # SECURITY: Only log traceback for 5xx errors, never for client errors
-    if status_code >= 500:
-        extra["traceback"] = traceback.format_exc()
-
+    # SECURITY: Only log traceback for 5xx errors, never for client errors.
+    # The handler formats it, and only if the record is emitted.
     logger.error(
-        f"API Error: {status_code}",
+        "API Error: %s",
+        status_code,
+        exc_info=error if status_code >= 500 else None,
         extra=extra
     )
 
 
-async def api_error_handler(request: Request, exc: APIError) -> JSONResponse:
+async def api_error_handler(request: Request, exc: APIError) -> Response:
     """Handle APIError exceptions."""
     log_error(request, exc, exc.status_code)
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=format_error_response(exc)
-    )
+    return error_response(exc)
 
 
-async def validation_error_handler(request: Request, exc: ValidationError) -> JSONResponse:
+async def validation_error_handler(request: Request, exc: ValidationError) -> Response:
     """Handle Pydantic ValidationError."""
+    # Only loc and msg are reported; skip building urls, ctx and input copies
+    errors = exc.errors(include_url=False, include_context=False, include_input=False)
     error = ValidationAPIError(
         "Request validation failed",
         details={
             "errors": [
                 {
-                    "field": error["loc"][-1],
-                    "message": error["msg"]
+                    "field": e["loc"][-1],
+                    "message": e["msg"]
                 }
-                for error in exc.errors()
+                for e in errors
             ]
         }
     )
     log_error(request, exc, error.status_code)
-    return JSONResponse(
-        status_code=error.status_code,
-        content=format_error_response(error)
-    )
+    return error_response(error)
 
 
-async def database_error_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
+async def database_error_handler(request: Request, exc: SQLAlchemyError) -> Response:
     """Handle database errors."""
-    logger.error(f"Database error: {str(exc)}", exc_info=True)
+    logger.error("Database error: %s", exc, exc_info=exc)
 
     # Handle integrity errors (e.g., unique constraint violations)
     if isinstance(exc, IntegrityError):
-        error = ConflictAPIError("Resource already exists or database constraint violation")
-    else:
-        error = InternalServerError("Database error occurred")
-
-    return JSONResponse(
-        status_code=error.status_code,
-        content=format_error_response(error)
-    )
+        return _body_response(_DATABASE_CONFLICT_BODY, status.HTTP_409_CONFLICT)
+    return _body_response(_DATABASE_500_BODY, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle all other exceptions (never expose details to client)."""
     # Log full exception details server-side
     logger.error(
-        f"Unhandled exception: {type(exc).__name__}: {str(exc)}",
-        exc_info=True,
+        "Unhandled exception: %s: %s",
+        type(exc).__name__,
+        exc,
+        exc_info=exc,
         extra={
             "path": request.url.path,
             "method": request.method,
@@ -210,15 +265,13 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
     )
 
     # Return generic error to client (never expose exception details)
-    error = InternalServerError("An unexpected error occurred")
-    return JSONResponse(
-        status_code=error.status_code,
-        content=format_error_response(error)
-    )
+    return _body_response(_GENERIC_500_BODY, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 def register_error_handlers(app: FastAPI) -> None:
     """Register all error handlers with FastAPI app."""
+    # Routes included after this point serialize with the same encoder
+    app.router.default_response_class = DefaultJSONResponse
     app.add_exception_handler(APIError, api_error_handler)
     app.add_exception_handler(ValidationError, validation_error_handler)
     app.add_exception_handler(SQLAlchemyError, database_error_handler)
@@ -2,11 +2,14 @@
 Custom exceptions and error handling utilities for Syntra.
 """
 
+import asyncio
 import logging
 import traceback
 from typing import Any, Dict, Optional, Type, Callable
-from functools import wraps
+from functools import lru_cache, wraps
 from fastapi import HTTPException, status
+import httpx
+import openai
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +21,8 @@ logger = logging.getLogger(__name__)
 class SyntraError(Exception):
     """Base exception for all Syntra errors."""
 
+    __slots__ = ("message", "code", "details")
+
     def __init__(
         self,
         message: str,
@@ -33,6 +38,8 @@ class SyntraError(Exception):
 class ValidationError(SyntraError):
     """Input validation errors."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, field: Optional[str] = None):
         super().__init__(
             message=message,
@@ -44,6 +51,8 @@ class ValidationError(SyntraError):
 class AuthenticationError(SyntraError):
     """Authentication failures."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Authentication required"):
         super().__init__(message=message, code="AUTH_ERROR")
 
@@ -51,6 +60,8 @@ class AuthenticationError(SyntraError):
 class AuthorizationError(SyntraError):
     """Authorization/permission failures."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Permission denied"):
         super().__init__(message=message, code="FORBIDDEN")
 
@@ -58,6 +69,8 @@ class AuthorizationError(SyntraError):
 class NotFoundError(SyntraError):
     """Resource not found errors."""
 
+    __slots__ = ()
+
     def __init__(self, resource: str, identifier: str):
         super().__init__(
             message=f"{resource} not found: {identifier}",
@@ -69,6 +82,8 @@ class NotFoundError(SyntraError):
 class ProviderError(SyntraError):
     """AI provider errors (OpenAI, Gemini, etc.)."""
 
+    __slots__ = ("provider", "original_error")
+
     def __init__(
         self,
         provider: str,
@@ -90,6 +105,8 @@ class ProviderError(SyntraError):
 class RateLimitError(SyntraError):
     """Rate limit exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(self, retry_after: Optional[int] = None):
         super().__init__(
             message="Rate limit exceeded",
@@ -102,6 +119,8 @@ class RateLimitError(SyntraError):
 class UsageLimitError(SyntraError):
     """Usage limit exceeded (subscription limits)."""
 
+    __slots__ = ()
+
     def __init__(self, limit_type: str, current: int, max_allowed: int):
         super().__init__(
             message=f"{limit_type} limit exceeded: {current}/{max_allowed}",
@@ -113,6 +132,8 @@ class UsageLimitError(SyntraError):
 class DatabaseError(SyntraError):
     """Database operation errors."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, operation: Optional[str] = None):
         super().__init__(
             message=message,
@@ -138,33 +159,37 @@ def handle_exceptions(
         log_level: Logging level for caught exceptions
         default_status_code: HTTP status code for unhandled exceptions
     """
+    log_func = getattr(logger, log_level)
+
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            try:
-                return await func(*args, **kwargs)
-            except HTTPException:
-                if reraise_http:
-                    raise
-                else:
-                    logger.warning(f"HTTPException in {func.__name__}")
-                    raise
-            except SyntraError as e:
-                log_func = getattr(logger, log_level)
-                log_func(
-                    f"SyntraError in {func.__name__}: {e.message}",
-                    extra={"code": e.code, "details": e.details}
-                )
-                raise HTTPException(
-                    status_code=_get_status_code(e),
-                    detail={"error": e.code, "message": e.message, "details": e.details}
-                )
-            except Exception as e:
-                logger.exception(f"Unhandled exception in {func.__name__}: {str(e)}")
-                raise HTTPException(
-                    status_code=default_status_code,
-                    detail={"error": "INTERNAL_ERROR", "message": "An unexpected error occurred"}
-                )
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except HTTPException:
+                    if reraise_http:
+                        raise
+                    else:
+                        logger.warning(f"HTTPException in {func.__name__}")
+                        raise
+                except SyntraError as e:
+                    log_func(
+                        f"SyntraError in {func.__name__}: {e.message}",
+                        extra={"code": e.code, "details": e.details}
+                    )
+                    raise HTTPException(
+                        status_code=_get_status_code(e),
+                        detail={"error": e.code, "message": e.message, "details": e.details}
+                    )
+                except Exception as e:
+                    logger.exception(f"Unhandled exception in {func.__name__}: {str(e)}")
+                    raise HTTPException(
+                        status_code=default_status_code,
+                        detail={"error": "INTERNAL_ERROR", "message": "An unexpected error occurred"}
+                    )
+
+            return async_wrapper
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
@@ -177,7 +202,6 @@ def handle_exceptions(
                     logger.warning(f"HTTPException in {func.__name__}")
                     raise
             except SyntraError as e:
-                log_func = getattr(logger, log_level)
                 log_func(f"SyntraError in {func.__name__}: {e.message}")
                 raise HTTPException(
                     status_code=_get_status_code(e),
@@ -190,28 +214,31 @@ def handle_exceptions(
                     detail={"error": "INTERNAL_ERROR", "message": "An unexpected error occurred"}
                 )
 
-        import asyncio
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
         return sync_wrapper
 
     return decorator
 
 
+_STATUS_BY_TYPE: Dict[Type[SyntraError], int] = {
+    ValidationError: status.HTTP_400_BAD_REQUEST,
+    AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+    AuthorizationError: status.HTTP_403_FORBIDDEN,
+    NotFoundError: status.HTTP_404_NOT_FOUND,
+    RateLimitError: status.HTTP_429_TOO_MANY_REQUESTS,
+    UsageLimitError: status.HTTP_402_PAYMENT_REQUIRED,
+    ProviderError: status.HTTP_502_BAD_GATEWAY,
+    DatabaseError: status.HTTP_503_SERVICE_UNAVAILABLE,
+}
+
+
 def _get_status_code(error: SyntraError) -> int:
     """Map SyntraError types to HTTP status codes."""
-    mapping = {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        AuthenticationError: status.HTTP_401_UNAUTHORIZED,
-        AuthorizationError: status.HTTP_403_FORBIDDEN,
-        NotFoundError: status.HTTP_404_NOT_FOUND,
-        RateLimitError: status.HTTP_429_TOO_MANY_REQUESTS,
-        UsageLimitError: status.HTTP_402_PAYMENT_REQUIRED,
-        ProviderError: status.HTTP_502_BAD_GATEWAY,
-        DatabaseError: status.HTTP_503_SERVICE_UNAVAILABLE,
-    }
-
-    for error_type, code in mapping.items():
+    code = _STATUS_BY_TYPE.get(type(error))
+    if code is not None:
+        return code
+
+    # Subclasses of the mapped errors
+    for error_type, code in _STATUS_BY_TYPE.items():
         if isinstance(error, error_type):
             return code
 
@@ -222,6 +249,63 @@ def _get_status_code(error: SyntraError) -> int:
 # PROVIDER ERROR HANDLING
 # =============================================================================
 
+def _on_rate_limit(provider: str, e: Exception) -> None:
+    logger.warning("%s rate limit hit", provider, extra={"error": str(e)})
+    raise RateLimitError(retry_after=60)
+
+
+def _on_auth_failed(provider: str, e: Exception) -> None:
+    logger.error("%s authentication failed", provider, extra={"error": str(e)})
+    raise ProviderError(provider, "Invalid API key", e)
+
+
+def _on_bad_request(provider: str, e: Exception) -> None:
+    logger.warning("%s bad request", provider, extra={"error": str(e)})
+    raise ProviderError(provider, str(e), e)
+
+
+def _on_connection_failed(provider: str, e: Exception) -> None:
+    logger.error("%s connection failed", provider, extra={"error": str(e)})
+    raise ProviderError(provider, "Connection failed", e)
+
+
+def _on_timeout(provider: str, e: Exception) -> None:
+    logger.error("%s request timeout", provider, extra={"error": str(e)})
+    raise ProviderError(provider, "Request timeout", e)
+
+
+def _on_http_status(provider: str, e: Exception) -> None:
+    logger.error("%s HTTP error", provider, extra={"status": e.response.status_code})
+    raise ProviderError(provider, f"HTTP {e.response.status_code}", e)
+
+
+def _on_unexpected(provider: str, e: Exception) -> None:
+    logger.exception("%s unexpected error", provider)
+    raise ProviderError(provider, f"Unexpected error: {type(e).__name__}", e)
+
+
+_PROVIDER_ERROR_HANDLERS: Dict[type, Callable[[str, Exception], None]] = {
+    # OpenAI specific errors
+    openai.RateLimitError: _on_rate_limit,
+    openai.AuthenticationError: _on_auth_failed,
+    openai.BadRequestError: _on_bad_request,
+    openai.APIConnectionError: _on_connection_failed,
+    # HTTP errors
+    httpx.TimeoutException: _on_timeout,
+    httpx.HTTPStatusError: _on_http_status,
+}
+
+
+@lru_cache(maxsize=128)
+def _provider_error_handler(error_type: type) -> Callable[[str, Exception], None]:
+    """Resolve (once per exception type) the handler for a provider error."""
+    for cls in error_type.__mro__:
+        handler = _PROVIDER_ERROR_HANDLERS.get(cls)
+        if handler is not None:
+            return handler
+    return _on_unexpected
+
+
 async def handle_provider_call(
     provider: str,
     operation: Callable,
@@ -239,40 +323,9 @@ async def handle_provider_call(
             messages=[...]
         )
     """
-    import openai
-    import httpx
-
     try:
         return await operation(*args, **kwargs)
-
-    # OpenAI specific errors
-    except openai.RateLimitError as e:
-        logger.warning(f"{provider} rate limit hit", extra={"error": str(e)})
-        raise RateLimitError(retry_after=60)
-
-    except openai.AuthenticationError as e:
-        logger.error(f"{provider} authentication failed", extra={"error": str(e)})
-        raise ProviderError(provider, "Invalid API key", e)
-
-    except openai.BadRequestError as e:
-        logger.warning(f"{provider} bad request", extra={"error": str(e)})
-        raise ProviderError(provider, str(e), e)
-
-    except openai.APIConnectionError as e:
-        logger.error(f"{provider} connection failed", extra={"error": str(e)})
-        raise ProviderError(provider, "Connection failed", e)
-
-    # HTTP errors
-    except httpx.TimeoutException as e:
-        logger.error(f"{provider} request timeout", extra={"error": str(e)})
-        raise ProviderError(provider, "Request timeout", e)
-
-    except httpx.HTTPStatusError as e:
-        logger.error(f"{provider} HTTP error", extra={"status": e.response.status_code})
-        raise ProviderError(provider, f"HTTP {e.response.status_code}", e)
-
-    # Generic errors
     except Exception as e:
-        logger.exception(f"{provider} unexpected error")
-        raise ProviderError(provider, f"Unexpected error: {type(e).__name__}", e)
-
+        # Every handler raises the mapped SyntraError
+        _provider_error_handler(type(e))(provider, e)
+        raise
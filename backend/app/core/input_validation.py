@@ -3,7 +3,7 @@
 import re
 import uuid
 from typing import Optional, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, model_validator, validator
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,6 +14,15 @@ UUID_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# Email regex pattern for validation
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Potentially dangerous SQL/scripting fragments, removed in this order
+DANGEROUS_PATTERNS = (';', '--', '/*', '*/', 'xp_', 'sp_', '<script', '</script>')
+# One scan over all patterns decides whether any removal is needed. The
+# removal itself cannot be a single multi-pattern pass (see sanitize_string).
+_DANGEROUS_RE = re.compile('|'.join(map(re.escape, DANGEROUS_PATTERNS)))
+
 
 class InputValidator:
     """Centralized input validation utility."""
@@ -24,6 +33,11 @@ class InputValidator:
         if not value:
             raise ValueError(f"{field_name} cannot be empty")
 
+        # Canonical form needs no UUID object; other accepted spellings
+        # (braces, urn:uuid:, no hyphens) still go through uuid.UUID
+        if UUID_PATTERN.fullmatch(value):
+            return value
+
         try:
             uuid.UUID(value)
             return value
@@ -64,9 +78,7 @@ class InputValidator:
     @staticmethod
     def validate_email(value: str) -> str:
         """Validate email format."""
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-
-        if not re.match(email_pattern, value):
+        if not EMAIL_PATTERN.match(value):
             raise ValueError(f"Invalid email format: {value}")
 
         return value
@@ -98,17 +110,32 @@ class InputValidator:
             return value
 
         # Always remove null bytes
-        value = value.replace('\x00', '')
-
-        if not allow_special:
-            # Remove potentially dangerous SQL/scripting characters
-            dangerous_patterns = [';', '--', '/*', '*/', 'xp_', 'sp_', '<script', '</script>']
-            for pattern in dangerous_patterns:
+        if '\x00' in value:
+            value = value.replace('\x00', '')
+
+        if not allow_special and _DANGEROUS_RE.search(value):
+            # Remove potentially dangerous SQL/scripting characters. Removal
+            # stays sequential: dropping one pattern can join the text around
+            # it into a later one (e.g. "<scr;ipt").
+            for pattern in DANGEROUS_PATTERNS:
                 value = value.replace(pattern, '')
 
         return value.strip()
 
 
+def _normalize_input(value: Any) -> Any:
+    """Strip strings and remove null bytes; other values pass through."""
+    if isinstance(value, str):
+        # Basic sanitization
+        value = value.strip()
+        if not value:
+            return value
+        # Remove null bytes
+        if '\x00' in value:
+            value = value.replace('\x00', '')
+    return value
+
+
 # Pydantic base model with validation
 class ValidatedRequestModel(BaseModel):
     """Base model for all validated API requests."""
@@ -118,17 +145,19 @@ class ValidatedRequestModel(BaseModel):
         validate_assignment = True
         str_strip_whitespace = True
 
-    @validator('*', pre=True)
-    def validate_input(cls, v):
-        """Validate all string inputs."""
-        if isinstance(v, str):
-            # Basic sanitization
-            v = v.strip()
-            if not v:
-                return v
-            # Remove null bytes
-            v = v.replace('\x00', '')
-        return v
+    @model_validator(mode='before')
+    @classmethod
+    def validate_input(cls, data: Any) -> Any:
+        """Validate all string inputs in one pass over the raw input."""
+        if isinstance(data, dict):
+            return {key: _normalize_input(value) for key, value in data.items()}
+        return data
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Model validators do not see assigned values; normalize them here
+        if name in type(self).model_fields:
+            value = _normalize_input(value)
+        super().__setattr__(name, value)
 
 
 # Common validated request models
@@ -4,19 +4,44 @@ Centralized logging configuration for Syntra.
 
 import logging
 import sys
+import time
 from typing import Optional
-from datetime import datetime
 import json
 from pathlib import Path
 import re
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging in production."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted record,
+        # swapped as one tuple so concurrent handlers never mix the two
+        self._cached_second = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        """UTC ISO timestamp of record.created, rendered like datetime.isoformat()."""
+        second = int(created)
+        micros = round((created - second) * 1e6)
+        if micros >= 1000000:
+            second += 1
+            micros -= 1000000
+
+        cached_second, prefix = self._cached_second
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._cached_second = (second, prefix)
+        return f"{prefix}.{micros:06d}" if micros else prefix
+
     def format(self, record: logging.LogRecord) -> str:
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -39,6 +64,8 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "duration_ms"):
             log_entry["duration_ms"] = record.duration_ms
 
+        if orjson is not None:
+            return orjson.dumps(log_entry).decode()
         return json.dumps(log_entry)
 
 
@@ -82,43 +109,79 @@ class SensitiveDataFilter(logging.Filter):
         (r'(openai_api_key|anthropic_key|google_api_key|stripe_key)["\']?\s*[:=]\s*["\']?([a-zA-Z0-9_\-\.]{20,})["\']?', r'\1***MASKED***'),
     ]
 
+    # Every pattern above requires one of these (case-insensitive) keywords,
+    # so text containing none of them can skip the patterns entirely
+    SENSITIVE_KEYWORDS = (
+        'key', 'secret', 'token', 'password', 'authorization', 'bearer', 'akia', 'sk-',
+    )
+
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter and mask sensitive data from log records."""
+        self._mask_text(record)
+        self._mask_context(record)
+        return True
+
+    @staticmethod
+    def _mask_text(record: logging.LogRecord) -> None:
+        """Mask secrets in the message, its args and the exception text."""
         # Mask in message
         if record.msg:
-            msg_str = str(record.msg)
-            for pattern, replacement in self.SENSITIVE_PATTERNS:
-                msg_str = re.sub(pattern, replacement, msg_str, flags=re.IGNORECASE)
-            record.msg = msg_str
+            record.msg = _mask_sensitive(str(record.msg))
 
         # Mask in args if present
         if record.args:
             if isinstance(record.args, dict):
                 for key, value in record.args.items():
                     if value and isinstance(value, str):
-                        for pattern, replacement in self.SENSITIVE_PATTERNS:
-                            record.args[key] = re.sub(pattern, replacement, value, flags=re.IGNORECASE)
+                        record.args[key] = _mask_sensitive(value)
             elif isinstance(record.args, tuple):
                 record.args = tuple(
-                    re.sub(pattern, replacement, str(arg), flags=re.IGNORECASE)
-                    if isinstance(arg, str) else arg
+                    _mask_sensitive(arg) if isinstance(arg, str) else arg
                     for arg in record.args
-                    for pattern, replacement in self.SENSITIVE_PATTERNS
                 )
 
-        # Mask in extra fields
-        if hasattr(record, 'org_id') and record.org_id:
+        # Mask in exception info
+        if record.exc_text:
+            record.exc_text = _mask_sensitive(record.exc_text)
+
+    @staticmethod
+    def _mask_context(record: logging.LogRecord) -> None:
+        """Mask request-context extra fields by slicing; no regex involved."""
+        org_id = getattr(record, 'org_id', None)
+        if org_id:
             # Mask org IDs partially: show first 8 chars
-            org_id = str(record.org_id)
+            org_id = str(org_id)
             if len(org_id) > 8:
                 record.org_id = org_id[:8] + '...***'
 
-        # Mask in exception info
-        if record.exc_text:
-            for pattern, replacement in self.SENSITIVE_PATTERNS:
-                record.exc_text = re.sub(pattern, replacement, record.exc_text, flags=re.IGNORECASE)
 
-        return True
+# Compiled once; filter() runs for every emitted record
+_COMPILED_SENSITIVE = [
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in SensitiveDataFilter.SENSITIVE_PATTERNS
+]
+_SENSITIVE_KEYWORDS = SensitiveDataFilter.SENSITIVE_KEYWORDS
+_SENSITIVE_KEYWORD_RE = re.compile(
+    '|'.join(map(re.escape, SensitiveDataFilter.SENSITIVE_KEYWORDS)), re.IGNORECASE
+)
+
+
+def _mask_sensitive(text: str) -> str:
+    """Apply every sensitive-data pattern to text, in order."""
+    # A keyword check decides whether any pattern can match. The patterns
+    # stay sequential: a combined alternation takes the leftmost match, which
+    # can swallow the start of a later secret (e.g. "sk-...password=x").
+    if text.isascii():
+        # Plain substring probes; re.IGNORECASE also folds a few non-ASCII
+        # letters (e.g. dotless i), so other text keeps the regex check
+        lowered = text.lower()
+        if not any(keyword in lowered for keyword in _SENSITIVE_KEYWORDS):
+            return text
+    elif not _SENSITIVE_KEYWORD_RE.search(text):
+        return text
+    for pattern, replacement in _COMPILED_SENSITIVE:
+        text = pattern.sub(replacement, text)
+    return text
 
 
 def setup_logging(
@@ -3,15 +3,14 @@
 from fastapi import Request, HTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
 import time
-from collections import defaultdict
-import asyncio
+from typing import Dict, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 class SimpleRateLimiter:
-    """Simple in-memory rate limiter based on client IP."""
+    """Simple in-memory token-bucket rate limiter based on client IP."""
 
     def __init__(self, requests_per_minute: int = 60):
         """
@@ -21,10 +20,13 @@ class SimpleRateLimiter:
             requests_per_minute: Number of allowed requests per minute per IP.
         """
         self.requests_per_minute = requests_per_minute
-        self.requests: dict = defaultdict(list)
-        self._lock = asyncio.Lock()
+        # Per-key bucket: (tokens left, time of last refill). Buckets hold up
+        # to a minute's allowance and refill continuously.
+        self.buckets: Dict[str, Tuple[float, float]] = {}
+        self._refill_per_second = requests_per_minute / 60
+        self._next_sweep = 0.0
 
-    async def is_allowed(self, key: str) -> bool:
+    def is_allowed(self, key: str) -> bool:
         """
         Check if a request is allowed for the given key.
 
@@ -34,20 +36,33 @@ class SimpleRateLimiter:
         Returns:
             True if request is allowed, False if rate limit exceeded.
         """
-        async with self._lock:
-            now = time.time()
-            minute_ago = now - 60
+        # No lock needed: nothing here awaits, so on the event loop the
+        # read-refill-write below never interleaves with another request
+        now = time.monotonic()
 
-            # Clean old requests outside the time window
-            self.requests[key] = [t for t in self.requests[key] if t > minute_ago]
+        # Forget idle clients once a minute so the dict stays bounded
+        if now >= self._next_sweep:
+            self._sweep(now - 60)
+            self._next_sweep = now + 60
 
-            # Check if limit exceeded
-            if len(self.requests[key]) >= self.requests_per_minute:
-                return False
+        # Refill for the time since the last request, capped at a minute's worth
+        capacity = self.requests_per_minute
+        tokens, last = self.buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - last) * self._refill_per_second)
 
-            # Record this request
-            self.requests[key].append(now)
-            return True
+        # Check if limit exceeded
+        if tokens < 1:
+            return False
+
+        # Record this request
+        self.buckets[key] = (tokens - 1, now)
+        return True
+
+    def _sweep(self, minute_ago: float) -> None:
+        """Drop buckets idle for a minute; they have refilled completely."""
+        stale = [key for key, (_, last) in self.buckets.items() if last <= minute_ago]
+        for key in stale:
+            del self.buckets[key]
 
 
 # Global rate limiter instance (1000 requests/minute per IP for development)
@@ -82,7 +97,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             client_ip = client_ip.split(",")[0].strip()
 
         # Check rate limit
-        if not await rate_limiter.is_allowed(client_ip):
+        if not rate_limiter.is_allowed(client_ip):
             logger.warning(f"Rate limit exceeded for IP: {client_ip}")
             raise HTTPException(
                 status_code=429,
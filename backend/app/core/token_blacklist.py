@@ -7,9 +7,12 @@ or a security incident occurs, tokens can be immediately revoked.
 
 import logging
 import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Optional
-from redis import Redis
+from typing import Optional, Tuple
+from redis.asyncio import Redis
 from config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -19,6 +22,27 @@ settings = get_settings()
 TOKEN_BLACKLIST_PREFIX = "token_blacklist:"
 TOKEN_REVOCATION_PREFIX = "token_revoked_at:"
 
+# Keys examined per SCAN round trip
+SCAN_BATCH_SIZE = 1000
+
+# In-process cache of is_revoked results. A revocation made on another
+# worker can take up to REVOCATION_CACHE_TTL seconds to be seen here.
+REVOCATION_CACHE_SIZE = 8192
+REVOCATION_CACHE_TTL = 30.0
+
+
+# The memo below keys on the raw bearer tokens, so up to this many live
+# tokens are held in process memory on purpose (cleared by clear_blacklist)
+TOKEN_ID_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=TOKEN_ID_CACHE_SIZE)
+def _token_id(token: str) -> str:
+    """SHA256 of a token, memoized: clients resend the same bearer token."""
+    # The hex digest is part of the Redis key format; changing its encoding
+    # would silently un-revoke every entry still live in Redis
+    return hashlib.sha256(token.encode()).hexdigest()
+
 
 class TokenBlacklist:
     """Manages revoked token storage in Redis."""
@@ -26,6 +50,8 @@ class TokenBlacklist:
     def __init__(self, redis_client: Redis):
         self.redis = redis_client
         self.enabled = True
+        # token_id -> (revoked, monotonic expiry), oldest first
+        self._revocation_cache: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
 
     async def revoke_token(self, token: str, ttl_seconds: Optional[int] = None) -> bool:
         """
@@ -48,13 +74,14 @@ class TokenBlacklist:
             key = f"{TOKEN_BLACKLIST_PREFIX}{token_id}"
 
             # Add to blacklist with TTL
-            result = self.redis.setex(
+            result = await self.redis.setex(
                 key,
                 ttl_seconds,
                 datetime.utcnow().isoformat()
             )
 
             if result:
+                self._cache_revocation(token_id, True)
                 logger.info(
                     f"Token revoked",
                     extra={
@@ -95,9 +122,15 @@ class TokenBlacklist:
             token_id = self._get_token_id(token)
             key = f"{TOKEN_BLACKLIST_PREFIX}{token_id}"
 
+            cached = self._cached_revocation(token_id)
+            if cached is not None:
+                return cached
+
             # Check if token is in blacklist
-            exists = self.redis.exists(key)
-            return exists == 1
+            exists = await self.redis.exists(key)
+            revoked = exists == 1
+            self._cache_revocation(token_id, revoked)
+            return revoked
 
         except Exception as e:
             logger.error(
@@ -125,7 +158,7 @@ class TokenBlacklist:
             key = f"{TOKEN_REVOCATION_PREFIX}{user_id}"
 
             # Mark user as revoked until TTL expires
-            self.redis.setex(
+            await self.redis.setex(
                 key,
                 ttl_seconds,
                 datetime.utcnow().isoformat()
@@ -163,7 +196,7 @@ class TokenBlacklist:
                 return False
 
             key = f"{TOKEN_REVOCATION_PREFIX}{user_id}"
-            exists = self.redis.exists(key)
+            exists = await self.redis.exists(key)
             return exists == 1
 
         except Exception as e:
@@ -174,7 +207,48 @@ class TokenBlacklist:
             self.enabled = False
             return False
 
-    def clear_blacklist(self) -> int:
+    async def is_auth_valid(self, token: str, user_id: str) -> bool:
+        """
+        Check token- and user-level revocation in one Redis round trip.
+
+        Args:
+            token: JWT token to check
+            user_id: Owner of the token
+
+        Returns:
+            False if the token or all of the user's tokens are revoked
+        """
+        try:
+            if not self.enabled:
+                # If revocation system is down, allow token (fail-open)
+                return True
+
+            token_id = self._get_token_id(token)
+            cached = self._cached_revocation(token_id)
+            if cached:
+                return False
+
+            user_key = f"{TOKEN_REVOCATION_PREFIX}{user_id}"
+            if cached is None:
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.exists(f"{TOKEN_BLACKLIST_PREFIX}{token_id}")
+                pipe.exists(user_key)
+                token_exists, user_exists = await pipe.execute()
+                self._cache_revocation(token_id, token_exists == 1)
+                return not (token_exists == 1 or user_exists == 1)
+
+            # Token known not revoked; only the user-level check remains
+            return await self.redis.exists(user_key) != 1
+
+        except Exception as e:
+            logger.error(
+                f"Failed to check auth revocation: {str(e)}",
+                exc_info=True
+            )
+            self.enabled = False
+            return True
+
+    async def clear_blacklist(self) -> int:
         """
         Clear all tokens from blacklist (use with caution).
 
@@ -187,12 +261,15 @@ class TokenBlacklist:
             deleted = 0
 
             while True:
-                cursor, keys = self.redis.scan(cursor, match=pattern, count=100)
+                cursor, keys = await self.redis.scan(cursor, match=pattern, count=SCAN_BATCH_SIZE)
                 if keys:
-                    deleted += self.redis.delete(*keys)
+                    # UNLINK frees the memory in the background on the server
+                    deleted += await self.redis.unlink(*keys)
                 if cursor == 0:
                     break
 
+            self._revocation_cache.clear()
+            _token_id.cache_clear()
             logger.warning(f"Blacklist cleared: {deleted} tokens removed")
             return deleted
 
@@ -200,15 +277,16 @@ class TokenBlacklist:
             logger.error(f"Failed to clear blacklist: {str(e)}", exc_info=True)
             return 0
 
-    def get_stats(self) -> dict:
+    async def get_stats(self) -> dict:
         """Get statistics about the token blacklist."""
         try:
             pattern = f"{TOKEN_BLACKLIST_PREFIX}*"
             count = 0
             cursor = 0
 
+            # Entries expire via TTL, so only a scan gives a true count
             while True:
-                cursor, keys = self.redis.scan(cursor, match=pattern, count=100)
+                cursor, keys = await self.redis.scan(cursor, match=pattern, count=SCAN_BATCH_SIZE)
                 count += len(keys)
                 if cursor == 0:
                     break
@@ -226,14 +304,35 @@ class TokenBlacklist:
                 "error": str(e)
             }
 
+    def _cached_revocation(self, token_id: str) -> Optional[bool]:
+        """Return a fresh cached is_revoked result, or None."""
+        entry = self._revocation_cache.get(token_id)
+        if entry is None:
+            return None
+        revoked, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._revocation_cache[token_id]
+            return None
+        return revoked
+
+    def _cache_revocation(self, token_id: str, revoked: bool) -> None:
+        """Remember an is_revoked result, evicting the oldest past the cap."""
+        cache = self._revocation_cache
+        cache[token_id] = (revoked, time.monotonic() + REVOCATION_CACHE_TTL)
+        cache.move_to_end(token_id)
+        if len(cache) > REVOCATION_CACHE_SIZE:
+            cache.popitem(last=False)
+
     @staticmethod
     def _get_token_id(token: str) -> str:
         """
         Get a unique ID for a token.
 
-        Uses SHA256 hash of token to avoid storing full tokens.
+        Uses the SHA256 hash of the token, so Redis never stores full tokens.
+        The hash is memoized in-process, which keeps up to
+        TOKEN_ID_CACHE_SIZE recent raw tokens in memory as cache keys.
         """
-        return hashlib.sha256(token.encode()).hexdigest()
+        return _token_id(token)
 
 
 # Global token blacklist instance
@@ -258,7 +357,7 @@ async def get_token_blacklist() -> TokenBlacklist:
             )
 
             # Test connection
-            redis_client.ping()
+            await redis_client.ping()
             _blacklist = TokenBlacklist(redis_client)
             logger.info("Token blacklist initialized with Redis")
 
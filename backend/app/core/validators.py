@@ -13,6 +13,14 @@ UUID_REGEX = re.compile(
     re.IGNORECASE
 )
 
+# Basic email regex
+EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# ASCII control characters (ord < 32)
+CONTROL_CHAR_REGEX = re.compile(r'[\x00-\x1f]')
+
+VALID_PROVIDERS = frozenset({"openai", "gemini", "perplexity", "kimi", "anthropic", "claude"})
+
 
 def validate_uuid(value: str, field_name: str = "id") -> str:
     """Validate that a string is a valid UUID."""
@@ -22,7 +30,8 @@ def validate_uuid(value: str, field_name: str = "id") -> str:
             detail=f"{field_name} must be a non-empty string"
         )
 
-    if not UUID_REGEX.match(value):
+    # fullmatch: match() with "$" would also accept a trailing newline
+    if not UUID_REGEX.fullmatch(value):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"{field_name} must be a valid UUID"
@@ -99,14 +108,14 @@ def validate_provider_name(provider: Optional[str]) -> Optional[str]:
     if provider is None:
         return None
 
-    valid_providers = {"openai", "gemini", "perplexity", "kimi", "anthropic", "claude"}
-    if provider.lower() not in valid_providers:
+    normalized = provider.lower()
+    if normalized not in VALID_PROVIDERS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid provider: {provider}. Must be one of: {', '.join(valid_providers)}"
+            detail=f"Invalid provider: {provider}. Must be one of: {', '.join(sorted(VALID_PROVIDERS))}"
         )
 
-    return provider.lower()
+    return normalized
 
 
 def validate_model_name(model: Optional[str]) -> Optional[str]:
@@ -128,7 +137,7 @@ def validate_model_name(model: Optional[str]) -> Optional[str]:
         )
 
     # Basic sanity check - no control characters
-    if any(ord(c) < 32 for c in model):
+    if CONTROL_CHAR_REGEX.search(model):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Model name contains invalid characters"
@@ -190,12 +199,7 @@ def validate_email(email: Optional[str]) -> Optional[str]:
 
     email = email.strip().lower()
 
-    # Basic email regex
-    email_regex = re.compile(
-        r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    )
-
-    if not email_regex.match(email):
+    if not EMAIL_REGEX.match(email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid email format"
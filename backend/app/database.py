@@ -1,4 +1,9 @@
 """Database configuration and session management."""
+import socket
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from config import get_settings
@@ -10,18 +15,64 @@ settings = get_settings()
 # Session pooler (port 5432) won't work - context gets lost between requests
 db_url = settings.database_url  # Use local database for development
 
+TRANSACTION_POOLER_PORT = 6543
+
+
+def _connect_args(url: str) -> dict:
+    """asyncpg connect args; pooler-safe statement handling on port 6543."""
+    connect_args = {
+        "server_settings": {"application_name": "syntra_backend"},
+        "timeout": 10,  # Fail fast when the pooler is unreachable
+    }
+    if make_url(url).port == TRANSACTION_POOLER_PORT:
+        # The transaction pooler hands each transaction to any server
+        # connection: cached or counter-named prepared statements collide
+        connect_args.update(
+            statement_cache_size=0,
+            prepared_statement_cache_size=0,
+            prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+        )
+    return connect_args
+
+
 engine = create_async_engine(
     db_url,
     echo=False,  # Disabled for performance - use SQLAlchemy logging if needed
-    pool_pre_ping=True,
-    pool_size=50,  # Increased for Supabase pooler
-    max_overflow=20,  # Added overflow for traffic spikes
-    pool_recycle=1800,  # Recycle connections every 30 minutes
-    connect_args={
-        "server_settings": {"application_name": "syntra_backend"}
-    }
+    # No pre-ping round trip per checkout: dead sockets are caught by TCP
+    # keepalive (below) and connections are recycled every 10 minutes
+    pool_pre_ping=False,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,  # Overflow for traffic spikes
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    echo_pool="debug" if settings.db_echo_pool else False,
+    query_cache_size=1200,  # Compiled SQL cache (default 500)
+    connect_args=_connect_args(db_url)
 )
 
+# Probe after 60s idle, then 3 probes 10s apart
+_TCP_KEEPALIVE_OPTIONS = (
+    ("TCP_KEEPIDLE", 60),
+    ("TCP_KEEPINTVL", 10),
+    ("TCP_KEEPCNT", 3),
+)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _enable_tcp_keepalive(dbapi_connection, connection_record):
+    """Turn on TCP keepalive for each new asyncpg connection."""
+    # asyncpg has no keepalive option; reach the socket via its transport
+    transport = getattr(dbapi_connection.driver_connection, "_transport", None)
+    sock = transport.get_extra_info("socket") if transport is not None else None
+    if sock is None or sock.family == socket.AF_UNIX:
+        return
+
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    for name, value in _TCP_KEEPALIVE_OPTIONS:
+        option = getattr(socket, name, None)  # Not every platform has all three
+        if option is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, option, value)
+
 # Create session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -35,9 +86,6 @@ Base = declarative_base()
 
 async def init_db():
     """Initialize database connection."""
-    # Import all models here to ensure they're registered
-    from app.models import org, user, thread, message, memory, audit, provider_key, access_graph, attachment, user_api_key  # noqa
-
     # In production, use Alembic migrations instead
     if not settings.is_production:
         async with engine.begin() as conn:
@@ -57,3 +105,8 @@ async def get_db() -> AsyncSession:
             yield session
         finally:
             await session.close()
+
+
+# Register every model with Base once, at import. Imported last: the model
+# modules import Base from here.
+import app.models  # noqa: E402,F401
@@ -10,11 +10,11 @@ episodic (user-centric) memories. Key responsibilities:
 """
 
 import asyncio
-import hashlib
 import json
 import time
-from typing import List, Dict, Optional, Any
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from datetime import datetime, timezone
 
 import httpx
 
@@ -25,28 +25,57 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+# Upper bound on cached results; least recently used entries are evicted first
+CACHE_MAX_ENTRIES = 10000
+
+# (kind, user_id, *query parts); dicts hash tuples natively
+CacheKey = Tuple[str, ...]
+
 
 class CacheEntry:
     """Cache entry with TTL support."""
 
+    __slots__ = ("value", "created_at", "ttl_seconds")
+
     def __init__(self, value: Any, ttl_seconds: int = 300):
         self.value = value
         self.created_at = time.time()
         self.ttl_seconds = ttl_seconds
 
-    def is_expired(self) -> bool:
-        """Check if cache entry has expired."""
-        return time.time() - self.created_at > self.ttl_seconds
-
 
 class SuperMemoryClient:
     """Async client for SuperMemory API."""
 
-    def __init__(self):
+    def __init__(self, max_cache_entries: int = CACHE_MAX_ENTRIES):
         self.api_key = settings.supermemory_api_key
         self.api_base_url = getattr(settings, "supermemory_api_base_url", "https://api.supermemory.ai")
-        self._cache: Dict[str, CacheEntry] = {}
+        # LRU order: oldest first
+        self._cache: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        # Cache keys per (kind, user_id), so one user's entries can be
+        # invalidated without scanning the whole cache
+        self._cache_groups: Dict[CacheKey, Set[CacheKey]] = {}
+        self._max_cache_entries = max_cache_entries
+        # Requests currently on the wire, by cache key
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
         self._timeout = 10.0
+        # One pooled client for the process, so connections and TLS sessions
+        # are reused across calls instead of renegotiated per request
+        self._client = httpx.AsyncClient(
+            base_url=self.api_base_url,
+            timeout=self._timeout,
+            headers=self._get_headers(),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "SuperMemoryClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
 
     async def search_memories(
         self,
@@ -68,55 +97,67 @@ class SuperMemoryClient:
             List of memory fragments with metadata
         """
         try:
-            # Check cache first
-            cache_key = self._make_cache_key("search", user_id, query)
-            cached = self._get_cached(cache_key)
-            if cached is not None:
-                logger.info("[SuperMemory] Cache hit for search: {user_id}")
-                return cached
-
-            # Make API call
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(
-                    f"{self.api_base_url}/api/memories/search",
-                    headers=self._get_headers(),
-                    json={
-                        "containerTags": [user_id],  # SuperMemory uses containerTags for scoping
-                        "query": query,
-                        "limit": limit
-                    }
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    memories = data.get("memories", [])
-
-                    # Format response
-                    formatted = [
-                        {
-                            "text": m.get("content", ""),
-                            "id": m.get("id", ""),
-                            "tags": m.get("tags", []),
-                            "created_at": m.get("createdAt", ""),
-                            "relevance_score": m.get("relevanceScore", 0.5)
-                        }
-                        for m in memories
-                    ]
-
-                    # Cache result
-                    self._set_cache(cache_key, formatted, ttl_seconds=cache_ttl)
-
-                    logger.info("[SuperMemory] Found {len(formatted)} memories for {user_id}")
-                    return formatted
-                else:
-                    logger.error("[SuperMemory] Search error {response.status_code}: {response.text}")
-                    return []
+            # Check cache first (expired entries are replaced when the fresh
+            # result is stored)
+            cache_key = ("search", user_id, query)
+            entry = self._cache.get(cache_key)
+            if entry is not None and time.time() - entry.created_at <= entry.ttl_seconds:
+                self._cache.move_to_end(cache_key)
+                logger.info("[SuperMemory] Cache hit for search: %s", user_id)
+                return entry.value
+
+            return await self._coalesce(
+                cache_key, lambda: self._fetch_search(cache_key, user_id, query, limit, cache_ttl)
+            )
 
         except asyncio.TimeoutError:
-            logger.info("[SuperMemory] Search timeout for {user_id}")
+            logger.info("[SuperMemory] Search timeout for %s", user_id)
             return []
         except Exception as e:
-            logger.error("[SuperMemory] Search error: {e}")
+            logger.error("[SuperMemory] Search error: %s", e)
+            return []
+
+    async def _fetch_search(
+        self,
+        cache_key: CacheKey,
+        user_id: str,
+        query: str,
+        limit: int,
+        cache_ttl: int
+    ) -> List[Dict[str, Any]]:
+        """Run one search request and cache the formatted result."""
+        response = await self._client.post(
+            "/api/memories/search",
+            json={
+                "containerTags": [user_id],  # SuperMemory uses containerTags for scoping
+                "query": query,
+                "limit": limit
+            }
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            memories = data.get("memories", [])
+
+            # Format response
+            formatted = [
+                {
+                    "text": m.get("content", ""),
+                    "id": m.get("id", ""),
+                    "tags": m.get("tags", []),
+                    "created_at": m.get("createdAt", ""),
+                    "relevance_score": m.get("relevanceScore", 0.5)
+                }
+                for m in memories
+            ]
+
+            # Cache result
+            self._set_cache(cache_key, formatted, ttl_seconds=cache_ttl)
+
+            logger.info("[SuperMemory] Found %d memories for %s", len(formatted), user_id)
+            return formatted
+        else:
+            logger.error("[SuperMemory] Search error %s: %s", response.status_code, response.text)
             return []
 
     async def add_memory(
@@ -142,33 +183,31 @@ class SuperMemoryClient:
             tags = tags or []
             metadata = metadata or {}
 
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(
-                    f"{self.api_base_url}/api/memories/add",
-                    headers=self._get_headers(),
-                    json={
-                        "containerTags": [user_id],
-                        "content": memory_text,
-                        "tags": tags,
-                        "metadata": metadata,
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                )
-
-                if response.status_code in (200, 201):
-                    # Invalidate search cache for this user since we added new memory
-                    self._invalidate_cache_prefix(f"search:{user_id}")
-                    logger.info("[SuperMemory] Added memory for {user_id}")
-                    return True
-                else:
-                    logger.error("[SuperMemory] Add memory error {response.status_code}: {response.text}")
-                    return False
+            response = await self._client.post(
+                "/api/memories/add",
+                json={
+                    "containerTags": [user_id],
+                    "content": memory_text,
+                    "tags": tags,
+                    "metadata": metadata,
+                    "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+                }
+            )
+
+            if response.status_code in (200, 201):
+                # Invalidate search cache for this user since we added new memory
+                self._invalidate_cache_group("search", user_id)
+                logger.info("[SuperMemory] Added memory for %s", user_id)
+                return True
+            else:
+                logger.error("[SuperMemory] Add memory error %s: %s", response.status_code, response.text)
+                return False
 
         except asyncio.TimeoutError:
-            logger.info("[SuperMemory] Add memory timeout for {user_id}")
+            logger.info("[SuperMemory] Add memory timeout for %s", user_id)
             return False
         except Exception as e:
-            logger.error("[SuperMemory] Add memory error: {e}")
+            logger.error("[SuperMemory] Add memory error: %s", e)
             return False
 
     async def get_user_preferences(
@@ -187,36 +226,48 @@ class SuperMemoryClient:
             Dictionary with user preferences
         """
         try:
-            # Check cache first
-            cache_key = self._make_cache_key("prefs", user_id)
-            cached = self._get_cached(cache_key)
-            if cached is not None:
-                logger.info("[SuperMemory] Cache hit for preferences: {user_id}")
-                return cached
-
-            # Make API call
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.get(
-                    f"{self.api_base_url}/api/users/{user_id}/preferences",
-                    headers=self._get_headers()
-                )
-
-                if response.status_code == 200:
-                    prefs = response.json().get("preferences", {})
-                    self._set_cache(cache_key, prefs, ttl_seconds=cache_ttl)
-                    logger.info("[SuperMemory] Retrieved preferences for {user_id}")
-                    return prefs
-                else:
-                    logger.error("[SuperMemory] Preferences error {response.status_code}")
-                    return {}
+            # Check cache first (inlined, as in search_memories)
+            cache_key = ("prefs", user_id)
+            entry = self._cache.get(cache_key)
+            if entry is not None and time.time() - entry.created_at <= entry.ttl_seconds:
+                self._cache.move_to_end(cache_key)
+                logger.info("[SuperMemory] Cache hit for preferences: %s", user_id)
+                return entry.value
+
+            return await self._coalesce(
+                cache_key, lambda: self._fetch_preferences(cache_key, user_id, cache_ttl)
+            )
 
         except asyncio.TimeoutError:
-            logger.info("[SuperMemory] Preferences timeout for {user_id}")
+            logger.info("[SuperMemory] Preferences timeout for %s", user_id)
             return {}
         except Exception as e:
-            logger.error("[SuperMemory] Preferences error: {e}")
+            logger.error("[SuperMemory] Preferences error: %s", e)
+            return {}
+
+    async def _fetch_preferences(self, cache_key: CacheKey, user_id: str, cache_ttl: int) -> Dict[str, Any]:
+        """Run one preferences request and cache the result."""
+        response = await self._client.get(f"/api/users/{user_id}/preferences")
+
+        if response.status_code == 200:
+            prefs = response.json().get("preferences", {})
+            self._set_cache(cache_key, prefs, ttl_seconds=cache_ttl)
+            logger.info("[SuperMemory] Retrieved preferences for %s", user_id)
+            return prefs
+        else:
+            logger.error("[SuperMemory] Preferences error %s", response.status_code)
             return {}
 
+    async def _coalesce(self, key: CacheKey, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Share one in-flight request between concurrent callers with the same key."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # A cancelled caller must not cancel the request the others wait on
+        return await asyncio.shield(task)
+
     def _get_headers(self) -> Dict[str, str]:
         """Get HTTP headers for SuperMemory API requests."""
         return {
@@ -225,34 +276,33 @@ class SuperMemoryClient:
             "User-Agent": "Syntra/1.0"
         }
 
-    def _make_cache_key(self, *args: str) -> str:
-        """Create cache key from multiple parts."""
-        combined = ":".join(str(arg) for arg in args)
-        return hashlib.md5(combined.encode()).hexdigest()
-
-    def _get_cached(self, key: str) -> Optional[Any]:
-        """Get value from cache if not expired."""
-        if key in self._cache:
-            entry = self._cache[key]
-            if not entry.is_expired():
-                return entry.value
-            else:
-                del self._cache[key]
-        return None
-
-    def _set_cache(self, key: str, value: Any, ttl_seconds: int = 300) -> None:
-        """Set cache entry."""
+    def _set_cache(self, key: CacheKey, value: Any, ttl_seconds: int = 300) -> None:
+        """Set cache entry, evicting the least recently used one when full."""
         self._cache[key] = CacheEntry(value, ttl_seconds=ttl_seconds)
-
-    def _invalidate_cache_prefix(self, prefix: str) -> None:
-        """Invalidate all cache entries matching a prefix."""
-        keys_to_delete = [k for k in self._cache.keys() if k.startswith(prefix)]
-        for key in keys_to_delete:
-            del self._cache[key]
+        self._cache.move_to_end(key)
+        self._cache_groups.setdefault(key[:2], set()).add(key)
+        if len(self._cache) > self._max_cache_entries:
+            old_key, _ = self._cache.popitem(last=False)
+            self._unindex(old_key)
+
+    def _unindex(self, key: CacheKey) -> None:
+        """Remove a key from its (kind, user_id) index."""
+        group = key[:2]
+        keys = self._cache_groups.get(group)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._cache_groups[group]
+
+    def _invalidate_cache_group(self, kind: str, user_id: str) -> None:
+        """Invalidate all cache entries of one kind for a user."""
+        for key in self._cache_groups.pop((kind, user_id), ()):
+            self._cache.pop(key, None)
 
     def clear_cache(self) -> None:
         """Clear entire cache."""
         self._cache.clear()
+        self._cache_groups.clear()
 
 
 # Singleton instance
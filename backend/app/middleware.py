@@ -1,4 +1,5 @@
 """FastAPI middleware for observability."""
+import re
 import time
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -6,6 +7,9 @@ from starlette.types import ASGIApp
 
 from app.observability import metrics_collector, RequestMetrics, classify_error
 
+# Segment after the first "orgs" segment (e.g. /api/orgs/{org_id}/...)
+_ORG_ID_RE = re.compile(r"/orgs/([^/]*)")
+
 
 class ObservabilityMiddleware(BaseHTTPMiddleware):
     """
@@ -21,18 +25,12 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
 
     async def dispatch(self, request: Request, call_next):
         """Process request and track metrics."""
-        start_time = time.time()
+        # Monotonic clock: durations are immune to wall-clock adjustments
+        start_time = time.monotonic()
 
         # Extract org_id from path if present (e.g., /api/orgs/{org_id}/...)
-        org_id = None
-        path_parts = request.url.path.split("/")
-        if "orgs" in path_parts:
-            try:
-                org_idx = path_parts.index("orgs")
-                if org_idx + 1 < len(path_parts):
-                    org_id = path_parts[org_idx + 1]
-            except (ValueError, IndexError):
-                pass
+        match = _ORG_ID_RE.search(request.url.path)
+        org_id = match.group(1) if match else None
 
         # Extract provider from query/body if applicable
         provider = None
@@ -56,7 +54,7 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
 
         finally:
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
 
             # Record metrics
             metrics = RequestMetrics(
@@ -69,4 +67,5 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
                 error_class=error_class,
             )
 
-            metrics_collector.record_request(metrics)
+            # Recorded by the background consumer, off the request path
+            metrics_collector.enqueue(metrics)
@@ -15,10 +15,10 @@ class UserAgentPermission(Base):
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
 
     # User
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     # Agent (provider key: perplexity, openai, gemini, etc.)
-    agent_key = Column(String, nullable=False, index=True)
+    agent_key = Column(String, nullable=False)
 
     # Permission
     can_invoke = Column(Boolean, default=True, nullable=False)
@@ -30,6 +30,8 @@ class UserAgentPermission(Base):
     # Relationships
     user = relationship("User", back_populates="user_agent_permissions")
 
+    # Covers user_id lookups too. Not partial on revoked_at: revoked rows
+    # must stay findable (revocation checks, cascading deletes).
     __table_args__ = (
         Index('ix_user_agent_perm', 'user_id', 'agent_key'),
     )
@@ -49,7 +51,7 @@ class AgentResourcePermission(Base):
     org_id = Column(String, ForeignKey("orgs.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Agent
-    agent_key = Column(String, nullable=False, index=True)
+    agent_key = Column(String, nullable=False)
 
     # Resource (memory fragment ID, document ID, etc.)
     resource_key = Column(String, nullable=False, index=True)
@@ -64,6 +66,8 @@ class AgentResourcePermission(Base):
     # Relationships
     org = relationship("Org")
 
+    # Covers agent_key lookups too; full (not partial) so revoked grants are
+    # found and deny access
     __table_args__ = (
         Index('ix_agent_resource_perm', 'agent_key', 'resource_key'),
     )
@@ -1,6 +1,6 @@
 """Attachment model for messages."""
 from sqlalchemy import Column, String, DateTime, ForeignKey, Text, LargeBinary, Integer
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 import uuid
 
@@ -24,7 +24,9 @@ class Attachment(Base):
     file_size = Column(Integer, nullable=False)  # Size in bytes
 
     # Storage (dual-mode during migration)
-    file_data = Column(LargeBinary, nullable=True)  # Legacy BLOB (being phased out)
+    # Legacy BLOB (being phased out). Deferred so row loads never pull the
+    # payload; select it explicitly where it is needed.
+    file_data = deferred(Column(LargeBinary, nullable=True), raiseload=True)
     storage_path = Column(String, nullable=True)  # Supabase Storage path (NEW)
     storage_bucket = Column(String, default="attachments", nullable=True)  # Bucket name
 
@@ -1,5 +1,6 @@
 """Audit log model."""
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, JSON, Integer
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Integer, Index, LargeBinary, CheckConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -15,7 +16,7 @@ class AuditLog(Base):
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
 
     # Thread & turn
-    thread_id = Column(String, ForeignKey("threads.id", ondelete="CASCADE"), nullable=False, index=True)
+    thread_id = Column(String, ForeignKey("threads.id", ondelete="CASCADE"), nullable=False)
     message_id = Column(String, ForeignKey("messages.id", ondelete="SET NULL"), nullable=True)
     user_id = Column(String, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
 
@@ -25,13 +26,13 @@ class AuditLog(Base):
     reason = Column(Text, nullable=False)  # "why routed" explanation
 
     # Memory access
-    fragments_included = Column(JSON, nullable=False)  # Array of fragment IDs
-    fragments_excluded = Column(JSON, nullable=False)  # Array of {id, reason} objects
+    fragments_included = Column(JSONB, nullable=False)  # Array of fragment IDs
+    fragments_excluded = Column(JSONB, nullable=False)  # Array of {id, reason} objects
     scope = Column(String, nullable=False)  # auto, strict_private, allow_shared
 
-    # Hashes (for verification)
-    package_hash = Column(String, nullable=False)  # SHA-256 of outbound prompt + fragments
-    response_hash = Column(String, nullable=True)  # SHA-256 of response
+    # Hashes (for verification), raw 32-byte SHA-256 digests; hex only in API responses
+    package_hash = Column(LargeBinary(32), nullable=False)  # SHA-256 of outbound prompt + fragments
+    response_hash = Column(LargeBinary(32), nullable=True)  # SHA-256 of response
 
     # Token usage
     prompt_tokens = Column(Integer, nullable=True)
@@ -46,5 +47,14 @@ class AuditLog(Base):
     message = relationship("Message")
     user = relationship("User")
 
+    # Thread timelines (newest first) read straight off the index, no sort;
+    # GIN serves containment filters ("logs that included fragment X")
+    __table_args__ = (
+        Index('ix_audit_thread_created', 'thread_id', 'created_at'),
+        Index('ix_audit_fragments_included_gin', 'fragments_included', postgresql_using='gin'),
+        CheckConstraint('octet_length(package_hash) = 32', name='ck_audit_package_hash_len'),
+        CheckConstraint('octet_length(response_hash) = 32', name='ck_audit_response_hash_len'),
+    )
+
     def __repr__(self):
         return f"<AuditLog {self.id} ({self.provider}/{self.model})>"
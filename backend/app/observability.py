@@ -1,11 +1,17 @@
 """Observability and metrics tracking."""
+import asyncio
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Deque, Dict, Any, Iterable, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
+# Pending request metrics before new ones are dropped
+METRICS_QUEUE_SIZE = 10000
+# Most metrics recorded per consumer wakeup
+METRICS_BATCH_SIZE = 128
+
 
 class ErrorClass(str, Enum):
     """Error classification for observability."""
@@ -41,46 +47,106 @@ class MetricsCollector:
 
     def __init__(self, max_history: int = 1000):
         self.max_history = max_history
-        self.requests: list[RequestMetrics] = []
+        # Last N requests (FIFO)
+        self.requests: Deque[RequestMetrics] = deque(maxlen=max_history)
 
         # Aggregated metrics
         self.request_count_by_path: Dict[str, int] = defaultdict(int)
         self.request_count_by_org: Dict[str, int] = defaultdict(int)
         self.request_count_by_provider: Dict[str, int] = defaultdict(int)
         self.error_count_by_class: Dict[str, int] = defaultdict(int)
-        self.latency_by_path: Dict[str, list[float]] = defaultdict(list)
+        # Last 100 latencies per path for percentile calculations
+        self.latency_by_path: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=100))
 
         # Pacer metrics (Phase 2)
         self.pacer_rps_current: Dict[str, float] = {}  # Current RPS by provider
         self.http_429_total: int = 0  # Total HTTP 429 responses
 
+        # Background recording (see start()); metrics dropped when the queue is full
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self.dropped_total: int = 0
+
     def record_request(self, metrics: RequestMetrics):
         """Record request metrics."""
-        # Store in history (FIFO)
-        self.requests.append(metrics)
-        if len(self.requests) > self.max_history:
-            self.requests.pop(0)
-
-        # Update aggregations
-        self.request_count_by_path[metrics.path] += 1
-
-        if metrics.org_id:
-            self.request_count_by_org[metrics.org_id] += 1
-
-        if metrics.provider:
-            self.request_count_by_provider[metrics.provider] += 1
-
-        if metrics.error_class:
-            self.error_count_by_class[metrics.error_class.value] += 1
-
-        # Track latency (keep last 100 per path for percentile calculations)
-        self.latency_by_path[metrics.path].append(metrics.duration_ms)
-        if len(self.latency_by_path[metrics.path]) > 100:
-            self.latency_by_path[metrics.path].pop(0)
-
-        # Track 429 errors
-        if metrics.status_code == 429:
-            self.http_429_total += 1
+        self.record_batch((metrics,))
+
+    def record_batch(self, batch: Iterable[RequestMetrics]):
+        """Record a batch of request metrics."""
+        requests_append = self.requests.append
+        by_path = self.request_count_by_path
+        by_org = self.request_count_by_org
+        by_provider = self.request_count_by_provider
+        by_error = self.error_count_by_class
+        latency_by_path = self.latency_by_path
+        http_429 = 0
+
+        for metrics in batch:
+            requests_append(metrics)
+            by_path[metrics.path] += 1
+
+            if metrics.org_id:
+                by_org[metrics.org_id] += 1
+
+            if metrics.provider:
+                by_provider[metrics.provider] += 1
+
+            if metrics.error_class:
+                by_error[metrics.error_class.value] += 1
+
+            latency_by_path[metrics.path].append(metrics.duration_ms)
+
+            if metrics.status_code == 429:
+                http_429 += 1
+
+        self.http_429_total += http_429
+
+    def enqueue(self, metrics: RequestMetrics):
+        """
+        Hand request metrics to the background consumer.
+
+        Records inline when the consumer is not running (e.g. no app lifespan).
+        """
+        if self._queue is None:
+            self.record_request(metrics)
+            return
+        try:
+            self._queue.put_nowait(metrics)
+        except asyncio.QueueFull:
+            self.dropped_total += 1
+
+    def start(self):
+        """Start the background consumer (call from the running event loop)."""
+        if self._consumer is None:
+            self._queue = asyncio.Queue(maxsize=METRICS_QUEUE_SIZE)
+            self._consumer = asyncio.create_task(self._consume())
+
+    async def stop(self):
+        """Stop the background consumer and record whatever is still queued."""
+        if self._consumer is None:
+            return
+        self._consumer.cancel()
+        try:
+            await self._consumer
+        except asyncio.CancelledError:
+            pass
+
+        queue = self._queue
+        self._consumer = None
+        self._queue = None
+        pending = []
+        while not queue.empty():
+            pending.append(queue.get_nowait())
+        self.record_batch(pending)
+
+    async def _consume(self):
+        """Record queued metrics in batches."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < METRICS_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            self.record_batch(batch)
 
     def set_pacer_rps(self, provider: str, rps: float):
         """Set current RPS for a provider (for pacer metrics)."""
@@ -101,6 +167,7 @@ class MetricsCollector:
             "latency_stats": self._get_latency_stats(),
             "pacer_rps_current": dict(self.pacer_rps_current),
             "http_429_total": self.http_429_total,
+            "metrics_dropped_total": self.dropped_total,
         }
 
     def get_org_metrics(self, org_id: str) -> Dict[str, Any]:
@@ -18,21 +18,28 @@ Key differences from V1:
 
 import asyncio
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 import logging
 
 from app.config.workflow_registry import (
     pick_model_for_stage,
     get_creator_pool,
+    ProviderModel,
     StageId,
 )
 from app.config.collab_prompts import (
+    FUSED_SYSTEM_PROMPTS,
     GLOBAL_COLLAB_PROMPT,
     STAGE_SYSTEM_PROMPTS,
     build_messages_for_stage,
 )
 from app.models.provider_key import ProviderType
+from app.services.response_cache import (
+    generate_stage_cache_key,
+    get_cached_stage_output,
+    set_cached_stage_output,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -113,6 +120,17 @@ class CouncilVerdict:
 # STAGE IMPLEMENTATIONS
 # ============================================================================
 
+def build_stage_prompts(stage_id: StageId, user_question: str, context: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Build the (system_prompt, user_message) pair that call_model expects.
+
+    The system prompt is the precomputed global + stage prompt, so only the
+    per-request user message is rendered.
+    """
+    messages = build_messages_for_stage(stage_id, user_question, context)
+    return FUSED_SYSTEM_PROMPTS[stage_id], messages[-1].content
+
+
 async def call_model(
     provider: ProviderType,
     model_name: str,
@@ -135,27 +153,65 @@ async def call_model(
     return f"[Mock response from {model_name}]"
 
 
-async def run_analyst(ctx: StageContext, api_keys: Dict[str, str]) -> StageResult:
-    """Analyst stage: break down the problem"""
-    model = pick_model_for_stage("analyst", 0, "auto")
-    logger.info(f"🔮 Router selected {model.id} for analyst stage")
-
-    # Build messages using production prompts
-    messages = build_messages_for_stage("analyst", ctx.user_question, {})
+async def call_stage_model(
+    stage_id: StageId,
+    model: ProviderModel,
+    system_prompt: str,
+    user_message: str,
+    api_keys: Dict[str, str],
+    cacheable: bool = True,
+    **params: Any,
+) -> str:
+    """
+    Call the model for a stage, reusing the response for an identical request.
 
-    # Format messages for call_model (expects system_prompt + user_message)
-    system_prompts = [m["content"] for m in messages if m["role"] == "system"]
-    user_messages = [m["content"] for m in messages if m["role"] == "user"]
+    Stage prompts are deterministic, so retries with the same inputs are served
+    from the stage cache instead of the provider. Stages whose value is a fresh
+    sample (creator drafts) pass cacheable=False, so regenerating draws new
+    output.
+    """
+    if not cacheable:
+        return await call_model(
+            provider=model.provider,
+            model_name=model.model_name,
+            system_prompt=system_prompt,
+            user_message=user_message,
+            api_keys=api_keys,
+            **params,
+        )
 
-    combined_system = "\n\n".join(system_prompts)
-    user_message = user_messages[0] if user_messages else ctx.user_question
+    cache_key = generate_stage_cache_key(stage_id, model.id, system_prompt, user_message, **params)
+    cached = get_cached_stage_output(cache_key)
+    if cached is not None:
+        logger.info(f"♻️ Cache hit for {stage_id} stage ({model.id})")
+        return cached
 
     output = await call_model(
         provider=model.provider,
         model_name=model.model_name,
-        system_prompt=combined_system,
+        system_prompt=system_prompt,
         user_message=user_message,
         api_keys=api_keys,
+        **params,
+    )
+    set_cached_stage_output(cache_key, output)
+    return output
+
+
+async def run_analyst(ctx: StageContext, api_keys: Dict[str, str]) -> StageResult:
+    """Analyst stage: break down the problem"""
+    model = pick_model_for_stage("analyst", 0, "auto")
+    logger.info(f"🔮 Router selected {model.id} for analyst stage")
+
+    # Build messages using production prompts
+    combined_system, user_message = build_stage_prompts("analyst", ctx.user_question, {})
+
+    output = await call_stage_model(
+        "analyst",
+        model,
+        combined_system,
+        user_message,
+        api_keys,
         max_tokens=1500,
     )
 
@@ -173,22 +229,16 @@ async def run_researcher(ctx: StageContext, api_keys: Dict[str, str]) -> StageRe
     logger.info(f"🔮 Router selected {model.id} for researcher stage")
 
     # Build messages using production prompts
-    messages = build_messages_for_stage("researcher", ctx.user_question, {
+    combined_system, user_message = build_stage_prompts("researcher", ctx.user_question, {
         "analyst_output": ctx.analyst_output,
     })
 
-    system_prompts = [m["content"] for m in messages if m["role"] == "system"]
-    user_messages = [m["content"] for m in messages if m["role"] == "user"]
-
-    combined_system = "\n\n".join(system_prompts)
-    user_message = user_messages[0] if user_messages else ctx.user_question
-
-    output = await call_model(
-        provider=model.provider,
-        model_name=model.model_name,
-        system_prompt=combined_system,
-        user_message=user_message,
-        api_keys=api_keys,
+    output = await call_stage_model(
+        "researcher",
+        model,
+        combined_system,
+        user_message,
+        api_keys,
         max_tokens=2000,
     )
 
@@ -211,25 +261,20 @@ async def run_creator_multi(ctx: StageContext, api_keys: Dict[str, str]) -> Stag
     logger.info(f"📝 Creator stage: running {len(creator_models)} models in parallel")
 
     # Build messages using production prompts
-    builder_messages = build_messages_for_stage("creator", ctx.user_question, {
+    combined_system, user_message = build_stage_prompts("creator", ctx.user_question, {
         "analyst_output": ctx.analyst_output,
         "researcher_output": ctx.researcher_output,
     })
 
-    system_prompts = [m["content"] for m in builder_messages if m["role"] == "system"]
-    user_messages = [m["content"] for m in builder_messages if m["role"] == "user"]
-
-    combined_system = "\n\n".join(system_prompts)
-    user_message = user_messages[0] if user_messages else ctx.user_question
-
     # Run all creator models in parallel
     tasks = [
-        call_model(
-            provider=model.provider,
-            model_name=model.model_name,
-            system_prompt=combined_system,
-            user_message=user_message,
-            api_keys=api_keys,
+        call_stage_model(
+            "creator",
+            model,
+            combined_system,
+            user_message,
+            api_keys,
+            cacheable=False,  # Drafts are samples; never replay them
             max_tokens=2000,
             temperature=0.7,
         )
@@ -269,24 +314,18 @@ async def run_critic(ctx: StageContext, api_keys: Dict[str, str]) -> StageResult
     logger.info(f"🔮 Router selected {model.id} for critic stage")
 
     # Build messages using production prompts
-    messages = build_messages_for_stage("critic", ctx.user_question, {
+    combined_system, user_message = build_stage_prompts("critic", ctx.user_question, {
         "analyst_output": ctx.analyst_output,
         "researcher_output": ctx.researcher_output,
         "creator_drafts": ctx.creator_drafts,
     })
 
-    system_prompts = [m["content"] for m in messages if m["role"] == "system"]
-    user_messages = [m["content"] for m in messages if m["role"] == "user"]
-
-    combined_system = "\n\n".join(system_prompts)
-    user_message = user_messages[0] if user_messages else ctx.user_question
-
-    output = await call_model(
-        provider=model.provider,
-        model_name=model.model_name,
-        system_prompt=combined_system,
-        user_message=user_message,
-        api_keys=api_keys,
+    output = await call_stage_model(
+        "critic",
+        model,
+        combined_system,
+        user_message,
+        api_keys,
         max_tokens=1500,
     )
 
@@ -309,25 +348,19 @@ async def run_council(ctx: StageContext, api_keys: Dict[str, str]) -> StageResul
     logger.info(f"🔮 Router selected {model.id} for council stage")
 
     # Build messages using production prompts
-    messages = build_messages_for_stage("council", ctx.user_question, {
+    combined_system, user_message = build_stage_prompts("council", ctx.user_question, {
         "analyst_output": ctx.analyst_output,
         "researcher_output": ctx.researcher_output,
         "creator_drafts": ctx.creator_drafts,
         "critic_output": ctx.critic_output,
     })
 
-    system_prompts = [m["content"] for m in messages if m["role"] == "system"]
-    user_messages = [m["content"] for m in messages if m["role"] == "user"]
-
-    combined_system = "\n\n".join(system_prompts)
-    user_message = user_messages[0] if user_messages else ctx.user_question
-
-    output = await call_model(
-        provider=model.provider,
-        model_name=model.model_name,
-        system_prompt=combined_system,
-        user_message=user_message,
-        api_keys=api_keys,
+    output = await call_stage_model(
+        "council",
+        model,
+        combined_system,
+        user_message,
+        api_keys,
         max_tokens=500,
         json_mode=True,  # Request JSON response
     )
@@ -375,7 +408,7 @@ async def run_synth(ctx: StageContext, api_keys: Dict[str, str]) -> StageResult:
     logger.info(f"🔮 Router selected {model.id} for synthesizer stage")
 
     # Build messages using production prompts
-    messages = build_messages_for_stage("synth", ctx.user_question, {
+    combined_system, user_message = build_stage_prompts("synth", ctx.user_question, {
         "analyst_output": ctx.analyst_output,
         "researcher_output": ctx.researcher_output,
         "creator_drafts": ctx.creator_drafts,
@@ -383,18 +416,12 @@ async def run_synth(ctx: StageContext, api_keys: Dict[str, str]) -> StageResult:
         "council_verdict": ctx.council_verdict,
     })
 
-    system_prompts = [m["content"] for m in messages if m["role"] == "system"]
-    user_messages = [m["content"] for m in messages if m["role"] == "user"]
-
-    combined_system = "\n\n".join(system_prompts)
-    user_message = user_messages[0] if user_messages else ctx.user_question
-
-    output = await call_model(
-        provider=model.provider,
-        model_name=model.model_name,
-        system_prompt=combined_system,
-        user_message=user_message,
-        api_keys=api_keys,
+    output = await call_stage_model(
+        "synth",
+        model,
+        combined_system,
+        user_message,
+        api_keys,
         max_tokens=2500,
         temperature=0.4,  # Lower temp for final answer
     )
@@ -15,7 +15,7 @@ or "Analyst • gemini-2.0" depending on what the router picked.
 
 import json
 import asyncio
-from typing import AsyncGenerator, Dict, Any
+from typing import AsyncGenerator, AsyncIterable, AsyncIterator, Dict, Any, List
 from datetime import datetime
 import logging
 
@@ -37,6 +37,88 @@ def sse_event(event_type: str, data: Dict[str, Any]) -> str:
     return f"event: {event_type}\ndata: {json.dumps(payload, default=str)}\n\n"
 
 
+class StreamBuffer:
+    """
+    Coalesce small text pieces into larger SSE chunks.
+
+    A chunk is flushed once `size` bytes are buffered or `interval_ms` has
+    passed since the first buffered piece, whichever comes first. Size-based
+    flushes are cut after the last sentence or line break when there is one,
+    so the client renders whole sentences; the rest carries into the next
+    chunk.
+    """
+
+    SENTENCE_BREAKS = ("\n", ". ", "! ", "? ")
+
+    def __init__(self, size: int = 8192, interval_ms: float = 25):
+        self.size = size
+        self.interval = interval_ms / 1000
+
+    def _split(self, text: str) -> int:
+        """Index just past the last sentence break in text (or len(text))."""
+        cut = 0
+        for sep in self.SENTENCE_BREAKS:
+            i = text.rfind(sep)
+            if i >= 0:
+                cut = max(cut, i + len(sep))
+        return cut or len(text)
+
+    async def chunks(self, source: AsyncIterable[str]) -> AsyncIterator[str]:
+        """Yield coalesced chunks of the text pieces produced by source."""
+        loop = asyncio.get_running_loop()
+        pieces = source.__aiter__()
+        parts: List[str] = []
+        buffered = 0
+        deadline = 0.0
+        pending = None
+
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(pieces.__anext__())
+
+                timeout = max(0.0, deadline - loop.time()) if parts else None
+                done, _ = await asyncio.wait((pending,), timeout=timeout)
+                if not done:
+                    # Interval elapsed while waiting for the source
+                    yield "".join(parts)
+                    parts.clear()
+                    buffered = 0
+                    continue
+
+                task, pending = pending, None
+                try:
+                    piece = task.result()
+                except StopAsyncIteration:
+                    break
+
+                if not piece:
+                    continue
+                if not parts:
+                    deadline = loop.time() + self.interval
+                parts.append(piece)
+                buffered += len(piece.encode())
+
+                if buffered >= self.size:
+                    text = "".join(parts)
+                    cut = self._split(text)
+                    yield text[:cut]
+                    rest = text[cut:]
+                    parts = [rest] if rest else []
+                    buffered = len(rest.encode())
+                    deadline = loop.time() + self.interval
+                elif loop.time() >= deadline:
+                    yield "".join(parts)
+                    parts.clear()
+                    buffered = 0
+
+            if parts:
+                yield "".join(parts)
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
 async def run_collaborate_streaming_v2(
     user_question: str,
     api_keys: Dict[str, str],
@@ -114,14 +196,18 @@ async def run_collaborate_streaming_v2(
 
         final_answer = result.get("final_answer", "")
 
-        # Stream final answer in chunks (simulate streaming)
-        chunk_size = 100
-        for i in range(0, len(final_answer), chunk_size):
-            chunk = final_answer[i : i + chunk_size]
+        async def synth_pieces():
+            # Stream final answer in chunks (simulate streaming)
+            chunk_size = 100
+            for i in range(0, len(final_answer), chunk_size):
+                yield final_answer[i : i + chunk_size]
+                await asyncio.sleep(0.01)  # Small delay to simulate streaming
+
+        # Coalesce synth pieces so each SSE event carries more text
+        async for chunk in StreamBuffer().chunks(synth_pieces()):
             yield sse_event("final_answer_delta", {
                 "delta": chunk,
             })
-            await asyncio.sleep(0.01)  # Small delay to simulate streaming
 
         yield sse_event("final_answer_end", {
             "content": final_answer,
@@ -2,10 +2,12 @@
 
 Caches responses based on normalized prompt + context fingerprint.
 """
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 import hashlib
 import json
+import time
 
 # In-memory cache (swap for Redis in production)
 _cache: Dict[str, Dict[str, Any]] = {}
@@ -13,6 +15,11 @@ _cache: Dict[str, Dict[str, Any]] = {}
 # Cache TTL (default 1 hour)
 CACHE_TTL_SECONDS = 3600
 
+# Collaboration stage outputs: bounded LRU of key -> (expires_at, output),
+# oldest first; the least recently used entry is evicted on insert when full
+STAGE_CACHE_MAX_ENTRIES = 1024
+_stage_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
 
 def normalize_prompt(messages: list[Dict[str, str]], top_k_context: int = 5) -> str:
     """
@@ -99,6 +106,79 @@ def generate_cache_key(
     return hashlib.sha256(key_string.encode()).hexdigest()
 
 
+def generate_stage_cache_key(
+    stage_id: str,
+    model_id: str,
+    system_prompt: str,
+    user_message: str,
+    **params: Any,
+) -> str:
+    """
+    Generate cache key for a collaboration stage call.
+
+    Unlike generate_cache_key, the prompt is hashed exactly as sent: stage
+    prompts are built deterministically, so only a byte-identical request
+    may reuse a response.
+
+    Args:
+        stage_id: Pipeline stage
+        model_id: Registry model id
+        system_prompt: System prompt sent to the model
+        user_message: User message sent to the model
+        **params: Generation parameters (max_tokens, temperature, ...)
+
+    Returns:
+        Cache key (SHA256 hash)
+    """
+    payload = json.dumps(
+        [stage_id, model_id, system_prompt, user_message, params],
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get_cached_stage_output(cache_key: str) -> Optional[str]:
+    """
+    Get a cached stage output if available and not expired.
+
+    Args:
+        cache_key: Key from generate_stage_cache_key
+
+    Returns:
+        Cached model output or None
+    """
+    try:
+        expires_at, output = _stage_cache[cache_key]
+    except KeyError:
+        return None
+
+    if time.monotonic() > expires_at:
+        del _stage_cache[cache_key]
+        return None
+
+    _stage_cache.move_to_end(cache_key)
+    return output
+
+
+def set_cached_stage_output(
+    cache_key: str,
+    output: str,
+    ttl_seconds: int = CACHE_TTL_SECONDS
+) -> None:
+    """
+    Cache a stage output, evicting the least recently used entry when full.
+
+    Args:
+        cache_key: Key from generate_stage_cache_key
+        output: Model output to cache
+        ttl_seconds: Time to live in seconds
+    """
+    _stage_cache[cache_key] = (time.monotonic() + ttl_seconds, output)
+    _stage_cache.move_to_end(cache_key)
+    if len(_stage_cache) > STAGE_CACHE_MAX_ENTRIES:
+        _stage_cache.popitem(last=False)
+
+
 def get_cached(cache_key: str) -> Optional[Dict[str, Any]]:
     """Alias for get_cached_response (for compatibility)."""
     return get_cached_response(cache_key)
@@ -157,6 +237,7 @@ def set_cached_response(
 def clear_cache() -> None:
     """Clear all cached responses."""
     _cache.clear()
+    _stage_cache.clear()
 
 
 def get_cache_stats() -> Dict[str, Any]:
@@ -16,6 +16,13 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    # Size the pool so pool_size + max_overflow covers the coroutines that
+    # hold a DB session at once (per worker process)
+    db_pool_size: int = 50
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 10  # Seconds to wait for a free connection
+    db_pool_recycle: int = 600
+    db_echo_pool: bool = False  # Log pool checkouts/checkins (debugging only)
 
     # Qdrant
     qdrant_url: str
@@ -44,7 +44,9 @@ except ImportError:
     intelligent_router = None
     INTELLIGENT_ROUTER_AVAILABLE = False
 from app.middleware import ObservabilityMiddleware
+from app.observability import metrics_collector
 from app.adapters._client import get_client
+from app.integrations.supermemory_client import supermemory_client
 
 # OpenTelemetry instrumentation (Phase 4)
 try:
@@ -86,10 +88,15 @@ async def lifespan(app: FastAPI):
     
     # Warm provider connections (HTTP/2 + TLS handshake)
     await warm_provider_connections()
-    
+
+    # Record request metrics in the background
+    metrics_collector.start()
+
     yield
     # Shutdown
+    await metrics_collector.stop()
     await close_db()
+    await supermemory_client.close()
 
 
 app = FastAPI(
@@ -0,0 +1,33 @@
+"""Align access-graph and audit indexes with their queries.
+
+Revision ID: 20251220_tune_permission_audit_indexes
+Revises: 20251219_add_storage_columns
+Create Date: 2025-12-20
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251220_tune_permission_audit_indexes"
+down_revision = "20251219_add_storage_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Thread timelines: WHERE thread_id = ? ORDER BY created_at DESC
+    op.create_index("ix_audit_thread_created", "audit_logs", ["thread_id", "created_at"])
+
+    # Leading columns of the composite indexes already cover these
+    op.drop_index("ix_audit_logs_thread_id", table_name="audit_logs")
+    op.drop_index("ix_user_agent_permissions_user_id", table_name="user_agent_permissions")
+    op.drop_index("ix_user_agent_permissions_agent_key", table_name="user_agent_permissions")
+    op.drop_index("ix_agent_resource_permissions_agent_key", table_name="agent_resource_permissions")
+
+
+def downgrade() -> None:
+    op.create_index("ix_agent_resource_permissions_agent_key", "agent_resource_permissions", ["agent_key"])
+    op.create_index("ix_user_agent_permissions_agent_key", "user_agent_permissions", ["agent_key"])
+    op.create_index("ix_user_agent_permissions_user_id", "user_agent_permissions", ["user_id"])
+    op.create_index("ix_audit_logs_thread_id", "audit_logs", ["thread_id"])
+
+    op.drop_index("ix_audit_thread_created", table_name="audit_logs")
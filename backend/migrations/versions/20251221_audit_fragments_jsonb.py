@@ -0,0 +1,50 @@
+"""Store audit fragment lists as JSONB with a GIN index.
+
+Revision ID: 20251221_audit_fragments_jsonb
+Revises: 20251220_tune_permission_audit_indexes
+Create Date: 2025-12-21
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20251221_audit_fragments_jsonb"
+down_revision = "20251220_tune_permission_audit_indexes"
+branch_labels = None
+depends_on = None
+
+FRAGMENT_COLUMNS = ("fragments_included", "fragments_excluded")
+
+
+def upgrade() -> None:
+    for column in FRAGMENT_COLUMNS:
+        op.alter_column(
+            "audit_logs",
+            column,
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(),
+            existing_nullable=False,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+    op.create_index(
+        "ix_audit_fragments_included_gin",
+        "audit_logs",
+        ["fragments_included"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_fragments_included_gin", table_name="audit_logs")
+
+    for column in FRAGMENT_COLUMNS:
+        op.alter_column(
+            "audit_logs",
+            column,
+            existing_type=postgresql.JSONB(),
+            type_=sa.JSON(),
+            existing_nullable=False,
+            postgresql_using=f"{column}::json",
+        )
@@ -0,0 +1,45 @@
+"""Store audit package/response hashes as raw 32-byte digests.
+
+Revision ID: 20251222_audit_hashes_bytea
+Revises: 20251221_audit_fragments_jsonb
+Create Date: 2025-12-22
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20251222_audit_hashes_bytea"
+down_revision = "20251221_audit_fragments_jsonb"
+branch_labels = None
+depends_on = None
+
+# column -> nullable
+HASH_COLUMNS = {"package_hash": False, "response_hash": True}
+
+
+def upgrade() -> None:
+    for column, nullable in HASH_COLUMNS.items():
+        op.alter_column(
+            "audit_logs",
+            column,
+            existing_type=sa.String(),
+            type_=sa.LargeBinary(32),
+            existing_nullable=nullable,
+            postgresql_using=f"decode({column}, 'hex')",
+        )
+        op.create_check_constraint(
+            f"ck_audit_{column}_len", "audit_logs", f"octet_length({column}) = 32"
+        )
+
+
+def downgrade() -> None:
+    for column, nullable in HASH_COLUMNS.items():
+        op.drop_constraint(f"ck_audit_{column}_len", "audit_logs", type_="check")
+        op.alter_column(
+            "audit_logs",
+            column,
+            existing_type=sa.LargeBinary(32),
+            type_=sa.String(),
+            existing_nullable=nullable,
+            postgresql_using=f"encode({column}, 'hex')",
+        )
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import select
+from sqlalchemy.orm import undefer
 from app.database import AsyncSessionLocal
 from app.models.attachment import Attachment
 from app.models.thread import Thread
@@ -37,7 +38,7 @@ async def migrate_blobs():
 
         async with AsyncSessionLocal() as db:
             # Find attachments with BLOBs but no storage_path
-            stmt = select(Attachment).where(
+            stmt = select(Attachment).options(undefer(Attachment.file_data)).where(
                 Attachment.file_data.isnot(None),
                 Attachment.storage_path.is_(None)
             )
@@ -0,0 +1,190 @@
+"""Tests for collaboration stage prompt/message building."""
+
+import pytest
+from app.config.collab_prompts import (
+    GLOBAL_COLLAB_PROMPT,
+    MAX_DRAFT_CHARS,
+    STAGE_SYSTEM_PROMPTS,
+    Msg,
+    build_all_stage_messages,
+    build_messages_for_stage,
+    build_messages_for_stage_cached,
+    build_messages_from_blocks,
+    build_shared_context_blocks,
+    clear_stage_message_cache,
+    iter_user_content_parts,
+)
+
+
+@pytest.fixture
+def full_context():
+    """Context as seen by the synth stage at the end of the pipeline."""
+    return {
+        "analyst_output": "analysis",
+        "researcher_output": "findings",
+        "creator_drafts": [
+            {"model_id": "gpt-4o", "content": "draft one"},
+            {"model_id": "gemini-2.0", "content": "draft two"},
+        ],
+        "critic_output": "critique",
+        "council_verdict": {"best_draft_index": 1, "reasoning": "clearer"},
+    }
+
+
+class TestBuildMessagesForStage:
+    """Test build_messages_for_stage."""
+
+    def test_system_messages_prefix(self):
+        """Every known stage starts with the global and stage system prompts."""
+        for stage_id, prompt in STAGE_SYSTEM_PROMPTS.items():
+            messages = build_messages_for_stage(stage_id, "Q?", {})
+            assert messages[0] == Msg("system", GLOBAL_COLLAB_PROMPT)
+            assert messages[1] == Msg("system", prompt)
+            assert messages[2].role == "user"
+
+    def test_unknown_stage(self):
+        """Unknown stages only get the global prompt."""
+        messages = build_messages_for_stage("bogus", "Q?", {})
+        assert messages == (Msg("system", GLOBAL_COLLAB_PROMPT),)
+
+    def test_cache_control_provider(self):
+        """Anthropic gets content blocks with a cache breakpoint on the stage prompt."""
+        messages = build_messages_for_stage("critic", "Q?", {}, provider="anthropic")
+        assert messages[0].content == [{"type": "text", "text": GLOBAL_COLLAB_PROMPT}]
+        assert messages[1].content[-1]["cache_control"] == {"type": "ephemeral"}
+        assert messages[1].content[-1]["text"] == STAGE_SYSTEM_PROMPTS["critic"]
+        assert messages[2] == build_messages_for_stage("critic", "Q?", {})[2]
+
+    def test_other_providers_keep_flat_prompts(self):
+        """Providers without explicit cache breakpoints keep string content."""
+        messages = build_messages_for_stage("critic", "Q?", {}, provider="openai")
+        assert messages == build_messages_for_stage("critic", "Q?", {})
+
+    def test_messages_convert_to_dicts(self):
+        """Messages expose a dict form for SDKs that need mappings."""
+        messages = build_messages_for_stage("analyst", "Q?", {})
+        assert messages[-1]._asdict() == {"role": "user", "content": "User question:\nQ?"}
+
+    def test_analyst_user_message(self):
+        """Analyst only sees the user question."""
+        messages = build_messages_for_stage("analyst", "What is X?", {})
+        assert messages[-1].content == "User question:\nWhat is X?"
+
+    def test_braces_in_content_are_literal(self):
+        """Template rendering does not interpret braces in user content."""
+        context = {"analyst_output": "{researcher_output} {0}"}
+        content = build_messages_for_stage("researcher", "f({x})?", context)[-1].content
+        assert content == "User question:\nf({x})?\n\n[Analyst analysis]\n{researcher_output} {0}"
+
+    def test_critic_renders_drafts(self, full_context):
+        """Critic sees every creator draft, numbered from 1."""
+        content = build_messages_for_stage("critic", "Q?", full_context)[-1].content
+        assert "[Creator drafts]\nDraft 1 from gpt-4o:\ndraft one\n\nDraft 2 from gemini-2.0:\ndraft two\n" in content
+        assert "[Critic review]" not in content
+
+    def test_long_drafts_are_clipped(self):
+        """Drafts over the cap are truncated with a deterministic marker."""
+        context = {"creator_drafts": [{"model_id": "m", "content": "x" * (MAX_DRAFT_CHARS + 5)}]}
+        content = build_messages_for_stage("critic", "Q?", context)[-1].content
+        assert "x" * MAX_DRAFT_CHARS + "\n…[truncated 5 chars]\n" in content
+        assert content == build_messages_for_stage("critic", "Q?", context)[-1].content
+
+    def test_draft_cap_override(self):
+        """context['max_draft_chars'] overrides the default cap."""
+        context = {
+            "creator_drafts": [{"model_id": "m", "content": "abcdef"}],
+            "max_draft_chars": 3,
+        }
+        content = build_messages_for_stage("council", "Q?", context)[-1].content
+        assert "Draft 1 from m:\nabc\n…[truncated 3 chars]\n" in content
+
+    def test_synth_includes_verdict(self, full_context):
+        """Synth sees the critic review and council verdict."""
+        content = build_messages_for_stage("synth", "Q?", full_context)[-1].content
+        assert "[Critic review]\ncritique" in content
+        assert "[LLM Council verdict (JSON)]" in content
+        assert '"best_draft_index"' in content
+
+    def test_each_verdict_rendered_from_its_own_content(self, full_context):
+        """Memoized verdict text never leaks between verdict objects."""
+        for index in range(5):
+            context = {**full_context, "council_verdict": {"best_draft_index": index}}
+            content = build_messages_for_stage("synth", "Q?", context)[-1].content
+            assert f'"best_draft_index": {index}' in content
+
+
+class TestIterUserContentParts:
+    """Test iter_user_content_parts."""
+
+    def test_matches_built_message(self, full_context):
+        """Joined parts are byte-identical to the built user message."""
+        for stage_id in STAGE_SYSTEM_PROMPTS:
+            built = build_messages_for_stage(stage_id, "Q?", full_context)[-1].content
+            assert "".join(iter_user_content_parts(stage_id, "Q?", full_context)) == built
+
+    def test_unknown_stage(self):
+        """Unknown stages raise KeyError."""
+        with pytest.raises(KeyError):
+            iter_user_content_parts("bogus", "Q?", {})
+
+
+class TestBuildAllStageMessages:
+    """Test build_all_stage_messages."""
+
+    def test_matches_per_stage_builder(self, full_context):
+        """Batch output matches the per-stage builder for every stage."""
+        all_messages = build_all_stage_messages("Q?", full_context)
+        assert set(all_messages) == set(STAGE_SYSTEM_PROMPTS)
+        for stage_id, messages in all_messages.items():
+            assert messages == build_messages_for_stage(stage_id, "Q?", full_context)
+
+    def test_matches_without_drafts(self):
+        """Batch output matches when drafts and verdict are absent."""
+        context = {"analyst_output": "analysis", "researcher_output": "findings"}
+        for stage_id, messages in build_all_stage_messages("Q?", context).items():
+            assert messages == build_messages_for_stage(stage_id, "Q?", context)
+
+
+class TestSharedContextBlocks:
+    """Test build_shared_context_blocks / build_messages_from_blocks."""
+
+    def test_blocks_are_rendered(self, full_context):
+        """Shared sections are rendered up front."""
+        blocks = build_shared_context_blocks("Q?", full_context)
+        assert blocks["drafts_section"].startswith("\n[Creator drafts]\n")
+        assert blocks["verdict_section"].startswith("\n[LLM Council verdict (JSON)]\n")
+        assert blocks["creator_note"].startswith("\n\nNote:")
+
+    def test_matches_per_stage_builder(self, full_context):
+        """Messages built from blocks match the per-stage builder."""
+        blocks = build_shared_context_blocks("Q?", full_context)
+        for stage_id in STAGE_SYSTEM_PROMPTS:
+            messages = build_messages_from_blocks(stage_id, blocks)
+            assert messages == build_messages_for_stage(stage_id, "Q?", full_context)
+
+
+class TestBuildMessagesForStageCached:
+    """Test build_messages_for_stage_cached."""
+
+    def setup_method(self):
+        clear_stage_message_cache()
+
+    def test_matches_uncached(self, full_context):
+        """Cached output matches the uncached builder for every stage."""
+        for stage_id in STAGE_SYSTEM_PROMPTS:
+            cached = build_messages_for_stage_cached(stage_id, "Q?", full_context)
+            assert cached == build_messages_for_stage(stage_id, "Q?", full_context)
+
+    def test_repeat_call_hits_cache(self, full_context):
+        """Identical inputs return the same cached tuple."""
+        first = build_messages_for_stage_cached("synth", "Q?", full_context)
+        second = build_messages_for_stage_cached("synth", "Q?", dict(full_context))
+        assert first is second
+
+    def test_changed_context_misses_cache(self, full_context):
+        """A different critic output produces a different message."""
+        first = build_messages_for_stage_cached("council", "Q?", full_context)
+        changed = {**full_context, "critic_output": "other critique"}
+        second = build_messages_for_stage_cached("council", "Q?", changed)
+        assert "other critique" in second[-1].content
+        assert first != second
@@ -0,0 +1,27 @@
+"""Tests for the input validation helpers."""
+
+import uuid
+
+import pytest
+
+from app.core.input_validation import InputValidator
+
+
+class TestValidateUuid:
+    """Test InputValidator.validate_uuid."""
+
+    @pytest.mark.parametrize("value", [
+        str(uuid.UUID(int=1)),
+        str(uuid.UUID(int=1)).upper(),
+        "{%s}" % uuid.UUID(int=1),
+        uuid.UUID(int=1).hex,
+    ])
+    def test_accepts_uuid_spellings(self, value):
+        """Canonical and other uuid.UUID spellings are returned unchanged."""
+        assert InputValidator.validate_uuid(value) == value
+
+    @pytest.mark.parametrize("value", ["", "not-a-uuid", str(uuid.UUID(int=1)) + "\n"])
+    def test_rejects_invalid(self, value):
+        """Malformed values, including a trailing newline, are rejected."""
+        with pytest.raises(ValueError, match="org_id"):
+            InputValidator.validate_uuid(value, "org_id")
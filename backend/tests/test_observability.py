@@ -0,0 +1,71 @@
+"""Tests for the in-memory metrics collector."""
+
+import asyncio
+
+from app import observability
+from app.observability import ErrorClass, MetricsCollector, RequestMetrics
+
+
+def _metrics(path="/api/threads", status_code=200, **kwargs):
+    return RequestMetrics(path=path, method="GET", status_code=status_code, duration_ms=5.0, **kwargs)
+
+
+class TestRecordBatch:
+    """Test MetricsCollector.record_batch."""
+
+    def test_aggregates(self):
+        """Counters, history and latencies are updated for every record."""
+        collector = MetricsCollector()
+        collector.record_batch([
+            _metrics(org_id="org1", provider="openai"),
+            _metrics(status_code=429, error_class=ErrorClass.RATE_LIMIT_ERROR),
+        ])
+
+        summary = collector.get_summary()
+        assert summary["total_requests"] == 2
+        assert summary["requests_by_path"] == {"/api/threads": 2}
+        assert summary["requests_by_org"] == {"org1": 1}
+        assert summary["requests_by_provider"] == {"openai": 1}
+        assert summary["errors_by_class"] == {"rate_limit_error": 1}
+        assert summary["http_429_total"] == 1
+        assert summary["latency_stats"]["/api/threads"]["count"] == 2
+
+    def test_history_is_bounded(self):
+        """Only the last max_history requests and 100 latencies are kept."""
+        collector = MetricsCollector(max_history=3)
+        collector.record_batch(_metrics(org_id=str(i)) for i in range(150))
+        assert [m.org_id for m in collector.requests] == ["147", "148", "149"]
+        assert len(collector.latency_by_path["/api/threads"]) == 100
+
+
+class TestBackgroundRecording:
+    """Test MetricsCollector.enqueue/start/stop."""
+
+    def test_records_inline_without_consumer(self):
+        """Without a running consumer, enqueue records immediately."""
+        collector = MetricsCollector()
+        collector.enqueue(_metrics())
+        assert len(collector.requests) == 1
+
+    async def test_consumer_records_queued_metrics(self):
+        """Queued metrics are recorded by the consumer and flushed on stop."""
+        collector = MetricsCollector()
+        collector.start()
+        collector.enqueue(_metrics())
+        await asyncio.sleep(0)
+        assert len(collector.requests) == 1
+
+        collector.enqueue(_metrics())
+        await collector.stop()
+        assert len(collector.requests) == 2
+
+    async def test_full_queue_drops(self, monkeypatch):
+        """Metrics beyond the queue bound are counted and dropped."""
+        monkeypatch.setattr(observability, "METRICS_QUEUE_SIZE", 1)
+        collector = MetricsCollector()
+        collector.start()
+        collector.enqueue(_metrics())
+        collector.enqueue(_metrics())
+        assert collector.get_summary()["metrics_dropped_total"] == 1
+        await collector.stop()
+        assert len(collector.requests) == 1
@@ -0,0 +1,143 @@
+"""Tests for the collaboration orchestrator's stage calls."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.config.workflow_registry import get_creator_pool
+from app.services import response_cache
+from app.services.collaborate import orchestrator_v2
+from app.services.collaborate.orchestrator_v2 import StageContext, call_stage_model, run_creator_multi
+from app.services.response_cache import generate_stage_cache_key
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    response_cache.clear_cache()
+    yield
+    response_cache.clear_cache()
+
+
+@pytest.fixture
+def call_model(monkeypatch):
+    mock = AsyncMock(side_effect=lambda **kwargs: f"output from {kwargs['model_name']}")
+    monkeypatch.setattr(orchestrator_v2, "call_model", mock)
+    return mock
+
+
+@pytest.fixture
+def model():
+    return get_creator_pool()[0]
+
+
+class TestGenerateStageCacheKey:
+    """Test generate_stage_cache_key."""
+
+    def test_identical_inputs_same_key(self):
+        """The same stage, model, prompts and params give the same key."""
+        first = generate_stage_cache_key("analyst", "gpt-4o", "sys", "user", max_tokens=10, temperature=0)
+        second = generate_stage_cache_key("analyst", "gpt-4o", "sys", "user", temperature=0, max_tokens=10)
+        assert first == second
+
+    @pytest.mark.parametrize("changed", [
+        ("critic", "gpt-4o", "sys", "user", {"max_tokens": 10}),
+        ("analyst", "gemini-2.0", "sys", "user", {"max_tokens": 10}),
+        ("analyst", "gpt-4o", "sys2", "user", {"max_tokens": 10}),
+        ("analyst", "gpt-4o", "sys", "user2", {"max_tokens": 10}),
+        ("analyst", "gpt-4o", "sys", "user", {"max_tokens": 11}),
+    ])
+    def test_any_change_changes_key(self, changed):
+        """Every component of the request is part of the key."""
+        stage_id, model_id, system_prompt, user_message, params = changed
+        base = generate_stage_cache_key("analyst", "gpt-4o", "sys", "user", max_tokens=10)
+        assert generate_stage_cache_key(stage_id, model_id, system_prompt, user_message, **params) != base
+
+
+class TestCallStageModel:
+    """Test call_stage_model caching."""
+
+    async def test_repeat_call_skips_provider(self, call_model, model):
+        """A repeated deterministic stage call is served from the cache."""
+        first = await call_stage_model("analyst", model, "sys", "user", {}, max_tokens=10)
+        second = await call_stage_model("analyst", model, "sys", "user", {}, max_tokens=10)
+        assert first == second
+        assert call_model.await_count == 1
+
+    @pytest.mark.parametrize("change", [
+        {"user_message": "other"},
+        {"system_prompt": "other"},
+        {"max_tokens": 20},
+        {"model": get_creator_pool()[1]},
+    ])
+    async def test_different_request_misses(self, call_model, model, change):
+        """A different prompt, model or params goes back to the provider."""
+        request = {"model": model, "system_prompt": "sys", "user_message": "user", "max_tokens": 10}
+        await call_stage_model(
+            "analyst", request["model"], request["system_prompt"], request["user_message"], {},
+            max_tokens=request["max_tokens"],
+        )
+        request.update(change)
+        await call_stage_model(
+            "analyst", request["model"], request["system_prompt"], request["user_message"], {},
+            max_tokens=request["max_tokens"],
+        )
+        assert call_model.await_count == 2
+
+    async def test_uncacheable_call_always_reaches_provider(self, call_model, model):
+        """cacheable=False calls are neither served from nor stored in the cache."""
+        for _ in range(2):
+            await call_stage_model("creator", model, "sys", "user", {}, cacheable=False, temperature=0.7)
+        assert call_model.await_count == 2
+        assert not response_cache._stage_cache
+
+
+class TestStageCache:
+    """Test the bounded stage output cache."""
+
+    def test_least_recently_used_evicted(self, monkeypatch):
+        """The cache keeps at most STAGE_CACHE_MAX_ENTRIES, dropping the oldest unused."""
+        monkeypatch.setattr(response_cache, "STAGE_CACHE_MAX_ENTRIES", 2)
+        response_cache.set_cached_stage_output("a", "1")
+        response_cache.set_cached_stage_output("b", "2")
+        assert response_cache.get_cached_stage_output("a") == "1"
+        response_cache.set_cached_stage_output("c", "3")
+
+        assert response_cache.get_cached_stage_output("b") is None
+        assert list(response_cache._stage_cache) == ["a", "c"]
+
+    def test_expired_entry_dropped(self, monkeypatch):
+        """Entries past their TTL are removed on lookup."""
+        now = [100.0]
+        monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+        response_cache.set_cached_stage_output("a", "1", ttl_seconds=10)
+        now[0] += 11
+        assert response_cache.get_cached_stage_output("a") is None
+        assert not response_cache._stage_cache
+
+
+class TestRunCreatorMulti:
+    """Test run_creator_multi."""
+
+    async def test_failing_creator_drops_only_its_draft(self, monkeypatch):
+        """One provider failing does not cancel or drop the other drafts."""
+        failing = get_creator_pool()[1]
+
+        async def call_model(**kwargs):
+            if kwargs["model_name"] == failing.model_name:
+                raise RuntimeError("provider down")
+            return f"output from {kwargs['model_name']}"
+
+        monkeypatch.setattr(orchestrator_v2, "call_model", call_model)
+        ctx = StageContext(user_question="Q?")
+        result = await run_creator_multi(ctx, {})
+
+        expected = [m.id for m in get_creator_pool() if m is not failing]
+        assert [d["model_id"] for d in ctx.creator_drafts] == expected
+        assert result.status == "success"
+        assert result.metadata == {"draft_count": len(expected)}
+
+    async def test_regeneration_draws_new_drafts(self, call_model):
+        """Running the creator stage again calls every provider again."""
+        for _ in range(2):
+            await run_creator_multi(StageContext(user_question="Q?"), {})
+        assert call_model.await_count == 2 * len(get_creator_pool())
@@ -0,0 +1,50 @@
+"""Tests for the in-memory rate limiter."""
+
+import pytest
+
+from app.core import rate_limit
+from app.core.rate_limit import SimpleRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the limiter."""
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestSimpleRateLimiter:
+    """Test SimpleRateLimiter."""
+
+    def test_limits_per_key(self, clock):
+        """Each key gets its own allowance within the window."""
+        limiter = SimpleRateLimiter(requests_per_minute=3)
+        assert [limiter.is_allowed("a") for _ in range(4)] == [True, True, True, False]
+        assert limiter.is_allowed("b")
+
+    def test_tokens_refill_over_time(self, clock):
+        """Spent allowance comes back at requests_per_minute / 60 per second."""
+        limiter = SimpleRateLimiter(requests_per_minute=2)
+        assert limiter.is_allowed("a")
+        assert limiter.is_allowed("a")
+        assert not limiter.is_allowed("a")
+        clock[0] += 30
+        assert limiter.is_allowed("a")
+        assert not limiter.is_allowed("a")
+
+    def test_refill_is_capped(self, clock):
+        """Idle time never banks more than a minute's allowance."""
+        limiter = SimpleRateLimiter(requests_per_minute=2)
+        limiter.is_allowed("a")
+        clock[0] += 600
+        assert [limiter.is_allowed("a") for _ in range(3)] == [True, True, False]
+
+    def test_idle_keys_are_swept(self, clock):
+        """Keys idle for a full window are dropped on the next sweep."""
+        limiter = SimpleRateLimiter(requests_per_minute=2)
+        for key in ("a", "b", "c"):
+            limiter.is_allowed(key)
+        clock[0] += 61
+        limiter.is_allowed("d")
+        assert set(limiter.buckets) == {"d"}
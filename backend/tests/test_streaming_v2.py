@@ -0,0 +1,53 @@
+"""Tests for collaboration V2 stream coalescing."""
+
+import asyncio
+
+from app.services.collaborate.streaming_v2 import StreamBuffer
+
+
+async def _pieces(items, delay=0.0):
+    for item in items:
+        yield item
+        if delay:
+            await asyncio.sleep(delay)
+
+
+async def _collect(buffer, source):
+    return [chunk async for chunk in buffer.chunks(source)]
+
+
+class TestStreamBuffer:
+    """Test StreamBuffer."""
+
+    async def test_fast_source_is_coalesced(self):
+        """Pieces arriving within the interval are joined into one chunk."""
+        chunks = await _collect(StreamBuffer(), _pieces(["a", "b", "c"]))
+        assert chunks == ["abc"]
+
+    async def test_text_is_preserved(self):
+        """Chunks always join back to the original text."""
+        text = "One sentence. Another one! " * 200
+        pieces = [text[i:i + 7] for i in range(0, len(text), 7)]
+        chunks = await _collect(StreamBuffer(size=256), _pieces(pieces))
+        assert "".join(chunks) == text
+        assert len(chunks) < len(pieces)
+
+    async def test_size_flush_cuts_at_sentence(self):
+        """Size-triggered flushes end on a sentence break when possible."""
+        chunks = await _collect(StreamBuffer(size=16), _pieces(["Hello there. ", "General Kenobi"]))
+        assert chunks == ["Hello there. ", "General Kenobi"]
+
+    async def test_size_flush_without_sentence_break(self):
+        """Text with no sentence break is flushed whole, not one character at a time."""
+        chunks = await _collect(StreamBuffer(size=10), _pieces(["abcdefgh"] * 5))
+        assert chunks == ["abcdefghabcdefgh"] * 2 + ["abcdefgh"]
+
+    async def test_interval_flush(self):
+        """A stalled source does not hold buffered text past the interval."""
+        buffer = StreamBuffer(interval_ms=5)
+        chunks = await _collect(buffer, _pieces(["a", "b"], delay=0.05))
+        assert chunks == ["a", "b"]
+
+    async def test_empty_source(self):
+        """An empty source yields nothing."""
+        assert await _collect(StreamBuffer(), _pieces([])) == []
@@ -0,0 +1,160 @@
+"""Tests for the SuperMemory API client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.integrations import supermemory_client
+from app.integrations.supermemory_client import SuperMemoryClient
+
+
+def _response(status_code=200, payload=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload or {}
+    return response
+
+
+@pytest.fixture
+async def client():
+    supermemory = SuperMemoryClient()
+    yield supermemory
+    await supermemory.close()
+
+
+class TestSearchMemories:
+    """Test SuperMemoryClient.search_memories."""
+
+    async def test_concurrent_searches_share_request(self, client):
+        """Identical searches in flight at once issue one HTTP request."""
+        release = asyncio.Event()
+
+        async def post(*args, **kwargs):
+            await release.wait()
+            return _response(payload={"memories": [{"content": "likes tea", "id": "m1"}]})
+
+        client._client.post = AsyncMock(side_effect=post)
+        searches = [asyncio.ensure_future(client.search_memories("u1", "drinks")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*searches)
+
+        assert client._client.post.await_count == 1
+        assert all(result[0]["text"] == "likes tea" for result in results)
+        assert not client._inflight
+
+    async def test_cancelled_caller_does_not_cancel_others(self, client):
+        """Cancelling one waiter leaves the shared request running."""
+        release = asyncio.Event()
+
+        async def post(*args, **kwargs):
+            await release.wait()
+            return _response(payload={"memories": []})
+
+        client._client.post = AsyncMock(side_effect=post)
+        first = asyncio.ensure_future(client.search_memories("u1", "q"))
+        second = asyncio.ensure_future(client.search_memories("u1", "q"))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == []
+        assert client._client.post.await_count == 1
+
+    async def test_error_status_returns_empty(self, client):
+        """Non-200 responses degrade to an empty result."""
+        client._client.post = AsyncMock(return_value=_response(status_code=500))
+        assert await client.search_memories("u1", "q") == []
+
+    async def test_log_messages_are_formatted(self, client, caplog):
+        """Log records carry the actual user and count."""
+        client._client.post = AsyncMock(return_value=_response(payload={"memories": [{"content": "x"}]}))
+        with caplog.at_level("INFO", logger=supermemory_client.__name__):
+            await client.search_memories("u1", "q")
+        assert "[SuperMemory] Found 1 memories for u1" in caplog.messages
+
+
+class TestGetUserPreferences:
+    """Test SuperMemoryClient.get_user_preferences."""
+
+    async def test_concurrent_lookups_share_request(self, client):
+        """Concurrent preference lookups for one user issue one request."""
+        client._client.get = AsyncMock(return_value=_response(payload={"preferences": {"tone": "brief"}}))
+        results = await asyncio.gather(*(client.get_user_preferences("u1") for _ in range(3)))
+
+        assert client._client.get.await_count == 1
+        assert results == [{"tone": "brief"}] * 3
+
+
+class TestCache:
+    """Test the bounded LRU/TTL result cache."""
+
+    async def test_add_memory_invalidates_user_searches(self, client):
+        """A successful add drops that user's cached searches only."""
+        client._client.post = AsyncMock(return_value=_response(payload={"memories": []}))
+        await client.search_memories("u1", "q")
+        await client.search_memories("u2", "q")
+        client._client.post.return_value = _response(status_code=201)
+        assert await client.add_memory("u1", "new fact")
+
+        client._client.post.return_value = _response(payload={"memories": []})
+        client._client.post.reset_mock()
+        await client.search_memories("u1", "q")
+        await client.search_memories("u2", "q")
+        assert client._client.post.await_count == 1
+
+    async def test_least_recently_used_entry_evicted(self):
+        """The cache stays bounded and evicts the oldest unused search."""
+        supermemory = SuperMemoryClient(max_cache_entries=2)
+        supermemory._client.post = AsyncMock(return_value=_response(payload={"memories": []}))
+        try:
+            await supermemory.search_memories("u1", "a")
+            await supermemory.search_memories("u1", "b")
+            await supermemory.search_memories("u1", "a")  # hit; "b" is now oldest
+            await supermemory.search_memories("u2", "c")
+            assert supermemory._client.post.await_count == 3
+
+            await supermemory.search_memories("u1", "a")
+            await supermemory.search_memories("u1", "b")
+            assert supermemory._client.post.await_count == 4
+            assert supermemory._cache_groups == {("search", "u1"): {("search", "u1", "a"), ("search", "u1", "b")}}
+        finally:
+            await supermemory.close()
+
+    async def test_expired_preferences_refetched(self, client, monkeypatch):
+        """Preferences past their TTL go back to the API and replace the entry."""
+        now = [1000.0]
+        monkeypatch.setattr(supermemory_client.time, "time", lambda: now[0])
+        client._client.get = AsyncMock(return_value=_response(payload={"preferences": {"tone": "brief"}}))
+        await client.get_user_preferences("u1", cache_ttl=10)
+        now[0] += 11
+        client._client.get.return_value = _response(payload={"preferences": {"tone": "long"}})
+
+        assert await client.get_user_preferences("u1", cache_ttl=10) == {"tone": "long"}
+        assert await client.get_user_preferences("u1", cache_ttl=10) == {"tone": "long"}
+        assert client._client.get.await_count == 2
+        assert list(client._cache) == [("prefs", "u1")]
+
+    async def test_expired_search_refetched(self, client, monkeypatch):
+        """A search past its TTL goes back to the API."""
+        now = [1000.0]
+        monkeypatch.setattr(supermemory_client.time, "time", lambda: now[0])
+        client._client.post = AsyncMock(return_value=_response(payload={"memories": []}))
+        await client.search_memories("u1", "q", cache_ttl=10)
+        await client.search_memories("u1", "q", cache_ttl=10)
+        now[0] += 11
+        await client.search_memories("u1", "q", cache_ttl=10)
+        assert client._client.post.await_count == 2
+
+
+class TestAddMemory:
+    """Test SuperMemoryClient.add_memory."""
+
+    async def test_timestamp_is_utc_iso(self, client):
+        """The timestamp is timezone-aware UTC with millisecond precision."""
+        client._client.post = AsyncMock(return_value=_response(status_code=201))
+        assert await client.add_memory("u1", "fact")
+        timestamp = client._client.post.call_args.kwargs["json"]["timestamp"]
+        assert timestamp.endswith("+00:00")
+        assert len(timestamp.split(".")[1]) == len("123+00:00")
@@ -0,0 +1,105 @@
+"""Tests for the Redis-backed token blacklist."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("redis")
+
+from app.core import token_blacklist
+from app.core.token_blacklist import TokenBlacklist
+
+
+@pytest.fixture
+def redis():
+    client = AsyncMock()
+    client.setex.return_value = True
+    client.exists.return_value = 0
+    client.pipe = MagicMock()
+    client.pipe.execute = AsyncMock(return_value=[0, 0])
+    client.pipeline = MagicMock(return_value=client.pipe)
+    return client
+
+
+class TestIsRevoked:
+    """Test TokenBlacklist.is_revoked caching."""
+
+    async def test_repeat_checks_hit_cache(self, redis):
+        """A repeated check within the TTL does not go back to Redis."""
+        blacklist = TokenBlacklist(redis)
+        assert not await blacklist.is_revoked("tok")
+        assert not await blacklist.is_revoked("tok")
+        assert redis.exists.await_count == 1
+
+    async def test_revoke_updates_cache(self, redis):
+        """Revoking on this worker is visible immediately."""
+        blacklist = TokenBlacklist(redis)
+        assert not await blacklist.is_revoked("tok")
+        assert await blacklist.revoke_token("tok")
+        assert await blacklist.is_revoked("tok")
+        assert redis.exists.await_count == 1
+
+    async def test_cached_result_expires(self, redis, monkeypatch):
+        """Cached results are re-checked after the TTL."""
+        now = [100.0]
+        monkeypatch.setattr(token_blacklist.time, "monotonic", lambda: now[0])
+        blacklist = TokenBlacklist(redis)
+        await blacklist.is_revoked("tok")
+        redis.exists.return_value = 1
+        now[0] += token_blacklist.REVOCATION_CACHE_TTL
+        assert await blacklist.is_revoked("tok")
+        assert redis.exists.await_count == 2
+
+    async def test_cache_is_bounded(self, redis, monkeypatch):
+        """The oldest entries are evicted past the size cap."""
+        monkeypatch.setattr(token_blacklist, "REVOCATION_CACHE_SIZE", 2)
+        blacklist = TokenBlacklist(redis)
+        for token in ("a", "b", "c"):
+            await blacklist.is_revoked(token)
+        assert len(blacklist._revocation_cache) == 2
+        await blacklist.is_revoked("a")
+        assert redis.exists.await_count == 4
+
+
+class TestIsAuthValid:
+    """Test TokenBlacklist.is_auth_valid."""
+
+    @pytest.mark.parametrize("results, valid", [([0, 0], True), ([1, 0], False), ([0, 1], False)])
+    async def test_one_round_trip(self, redis, results, valid):
+        """Both checks go out in a single pipeline."""
+        redis.pipe.execute.return_value = results
+        assert await TokenBlacklist(redis).is_auth_valid("tok", "user") is valid
+        assert redis.pipe.exists.call_count == 2
+        redis.pipe.execute.assert_awaited_once()
+        redis.exists.assert_not_awaited()
+
+    async def test_cached_token_skips_pipeline(self, redis):
+        """With the token result cached, only the user check hits Redis."""
+        blacklist = TokenBlacklist(redis)
+        await blacklist.is_revoked("tok")
+        redis.exists.return_value = 1
+        assert not await blacklist.is_auth_valid("tok", "user")
+        redis.pipeline.assert_not_called()
+
+    async def test_revoked_token_short_circuits(self, redis):
+        """A token revoked on this worker needs no Redis call."""
+        blacklist = TokenBlacklist(redis)
+        await blacklist.revoke_token("tok")
+        assert not await blacklist.is_auth_valid("tok", "user")
+        redis.pipeline.assert_not_called()
+        redis.exists.assert_not_awaited()
+
+
+class TestClearBlacklist:
+    """Test TokenBlacklist.clear_blacklist."""
+
+    async def test_drops_in_process_token_memo(self, redis):
+        """Clearing also releases the raw tokens held by the hash memo."""
+        redis.scan.return_value = (0, [])
+        blacklist = TokenBlacklist(redis)
+        await blacklist.is_revoked("tok")
+        assert token_blacklist._token_id.cache_info().currsize > 0
+
+        await blacklist.clear_blacklist()
+        assert token_blacklist._token_id.cache_info().currsize == 0
+        assert not blacklist._revocation_cache
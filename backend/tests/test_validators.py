@@ -0,0 +1,90 @@
+"""Tests for request field validators."""
+
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.validators import (
+    validate_email,
+    validate_message_content,
+    validate_model_name,
+    validate_provider_name,
+    validate_uuid,
+)
+
+
+class TestValidateUuid:
+    """Test validate_uuid."""
+
+    def test_returns_lowercase(self):
+        """Valid UUIDs are returned lowercased."""
+        value = str(uuid.uuid4())
+        assert validate_uuid(value.upper()) == value
+
+    @pytest.mark.parametrize("value", ["", "not-a-uuid", str(uuid.uuid4()) + "\n", None])
+    def test_rejects_invalid(self, value):
+        """Malformed values, including a trailing newline, are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            validate_uuid(value, "thread_id")
+        assert exc_info.value.status_code == 400
+        assert "thread_id" in exc_info.value.detail
+
+
+class TestValidateEmail:
+    """Test validate_email."""
+
+    def test_normalizes(self):
+        """Emails are stripped and lowercased."""
+        assert validate_email("  Someone+tag@Example.co.UK ") == "someone+tag@example.co.uk"
+
+    @pytest.mark.parametrize("email", ["no-at.example.com", "a@b", "a b@example.com", "a@example.c"])
+    def test_rejects_invalid(self, email):
+        """Addresses outside the basic pattern are rejected."""
+        with pytest.raises(HTTPException):
+            validate_email(email)
+
+
+class TestValidateMessageContent:
+    """Test validate_message_content."""
+
+    def test_length_is_checked_after_strip(self):
+        """Edge whitespace does not count toward the limit."""
+        assert validate_message_content("  " + "x" * 10 + "\n", max_length=10) == "x" * 10
+
+    @pytest.mark.parametrize("content", ["", "   \n", "x" * 11])
+    def test_rejects_invalid(self, content):
+        """Empty, whitespace-only and oversize content is rejected."""
+        with pytest.raises(HTTPException):
+            validate_message_content(content, max_length=10)
+
+
+class TestValidateProviderName:
+    """Test validate_provider_name."""
+
+    def test_normalizes_case(self):
+        """Known providers are accepted case-insensitively and lowercased."""
+        assert validate_provider_name("OpenAI") == "openai"
+        assert validate_provider_name(None) is None
+
+    def test_error_lists_providers_in_order(self):
+        """The error message lists valid providers deterministically."""
+        with pytest.raises(HTTPException) as exc_info:
+            validate_provider_name("bogus")
+        assert exc_info.value.detail.endswith(
+            "Must be one of: anthropic, claude, gemini, kimi, openai, perplexity"
+        )
+
+
+class TestValidateModelName:
+    """Test validate_model_name."""
+
+    def test_strips_valid_name(self):
+        """Valid names are returned stripped."""
+        assert validate_model_name("  gpt-4o-mini ") == "gpt-4o-mini"
+
+    @pytest.mark.parametrize("model", ["gpt\x00", "gpt\tmini", "x" * 101, "   "])
+    def test_rejects_invalid(self, model):
+        """Control characters, overlong and blank names are rejected."""
+        with pytest.raises(HTTPException):
+            validate_model_name(model)